@@ -0,0 +1,4 @@
+# bangla_news
+# Engine modules behind the Streamlit pages. Nothing heavy is imported here:
+# torch and transformers load with bert_encoder, which only the embeddings
+# page imports.
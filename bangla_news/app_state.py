@@ -0,0 +1,130 @@
+# app_state.py
+import streamlit as st
+
+from .figure_cache import FigureCache
+from .instrumentation import Instrumentation, rows_of
+from .jobs import JobRunner
+from .memory_report import MemoryReport
+from .pipeline import Pipeline
+from .stage_cache import StageCache
+from .wordcloud_service import WordCloudService
+
+# ---------------------------
+# Stage cache (shared by all sessions)
+# ---------------------------
+# Every stage is keyed by its inputs and parameters; a rerun only
+# recomputes the stages whose fingerprint changed.
+@st.cache_resource
+def get_stage_cache():
+    return StageCache(".stage_cache", max_bytes=4 * 1024**3)
+
+
+# ---------------------------
+# Figure cache (shared by all sessions)
+# ---------------------------
+# Pages pass a draw function plus the aggregate it plots; the chart is only
+# drawn when that data or style has not been rendered before (figure_cache.py).
+@st.cache_resource
+def get_figure_cache():
+    return FigureCache(max_entries=512, max_bytes=256 * 1024**2)
+
+
+def show_pyplot(draw, *data, **style):
+    st.image(get_figure_cache().matplotlib(draw, *data, **style), width='stretch')
+
+
+def show_plotly(draw, *data, **style):
+    st.plotly_chart(get_figure_cache().plotly(draw, *data, **style), width='stretch')
+
+
+# ---------------------------
+# Word cloud service (shared by all sessions)
+# ---------------------------
+# Renders the clouds of every category on background threads once the counts
+# are available, so switching categories only reads a cached PNG.
+@st.cache_resource
+def get_wordcloud_service():
+    return WordCloudService(workers=2, max_entries=128, width=1000, height=500, max_words=100)
+
+
+# ---------------------------
+# Background jobs (shared by all sessions)
+# ---------------------------
+# Long stages run on the job runner (jobs.py) rather than in the script run;
+# at most two at a time on the whole server, and jobs with the same key are
+# shared between sessions.
+@st.cache_resource
+def get_job_runner():
+    return JobRunner(max_workers=2, max_finished=32)
+
+
+def show_job(job, label):
+    # Polls the job once a second while it is queued or running, and reruns
+    # the whole app once it has finished so the page can use its result
+    runner = get_job_runner()
+    was_active = job.active
+
+    @st.fragment(run_every=1.0 if was_active else None)
+    def job_status():
+        if job.cancelling:
+            st.info(f"{label}: cancelling...")
+        elif job.status == 'queued':
+            st.info(f"{label}: waiting for a free worker ({runner.queued_before(job)} queued ahead)")
+        elif job.status == 'running':
+            st.progress(job.fraction, text=f"{label}: {job.message or 'running'}")
+        elif job.status == 'done':
+            st.success(f"{label}: done in {job.wall_s:.1f} s")
+        elif job.status == 'failed':
+            st.error(f"{label} failed")
+            st.code(job.error)
+        else:
+            st.warning(f"{label}: cancelled")
+        if job.active and not job.cancelling and st.button("Cancel", key=f"cancel-{job.id}"):
+            job.cancel()
+        if was_active and not job.active:
+            st.rerun()
+
+    job_status()
+
+
+# ---------------------------
+# Per-run state
+# ---------------------------
+# The entry script calls begin_run on every rerun before the page runs; the
+# page reads this run's pipeline, instrumentation and memory report from the
+# session, and the sidebar panels read them after the page has finished.
+def begin_run(profile=False, **settings):
+    st.session_state['instrumentation'] = Instrumentation(profile=profile)
+    st.session_state['memory_report'] = MemoryReport()
+    st.session_state['pipeline'] = Pipeline(get_stage_cache(), run=run_stage, **settings)
+
+
+def pipeline():
+    return st.session_state['pipeline']
+
+
+def instrumentation():
+    return st.session_state['instrumentation']
+
+
+def memory_report():
+    return st.session_state['memory_report']
+
+
+# Every stage records wall time, CPU time, peak memory growth and rows/s for
+# this run. A stage that misses resolves its upstream stages inside its own
+# record, so their rows come first and its wall time includes them.
+def run_stage(stage, fn, resolve_args, deps=(), **params):
+    with instrumentation().stage(stage) as record:
+        value, key, hit = get_stage_cache().lookup(stage, fn, resolve_args, deps=deps, **params)
+        record['rows'] = rows_of(value)
+        record['cache'] = 'hit' if hit else 'miss'
+    return value, key
+
+
+# show_frame_info replaces st.text(df.info()): it shows deep memory usage per
+# column and records the frame for the memory panel.
+def show_frame_info(stage, name, frame):
+    table = memory_report().record(stage, name, frame)
+    st.write(f"{len(frame)} rows x {frame.shape[1]} columns, {table['MB'].sum():.1f} MB in memory")
+    st.dataframe(table.drop(columns='bytes'))
@@ -0,0 +1,79 @@
+# balancing.py
+import numpy as np
+import pandas as pd
+
+# ---------------------------
+# Index-based class balancing
+# ---------------------------
+# Every strategy works on integer positions only: rows are grouped by
+# category with one stable argsort, each category's positions are chosen,
+# and the frame is gathered with a single take at the end. Categories come
+# out in sorted order, like the groupby loop this replaces.
+#
+#   last        last target_size rows of each category (the original rule)
+#   random      seeded random target_size rows of each category
+#   time        target_size rows spread evenly over each category's dates
+#   oversample  like random, but smaller categories are topped up to
+#               target_size by sampling with replacement
+STRATEGIES = ['last', 'random', 'time', 'oversample']
+
+
+def _category_groups(categories):
+    codes, names = pd.factorize(np.asarray(categories, dtype=object), sort=True)
+    order = np.argsort(codes, kind='stable')
+    bounds = np.searchsorted(codes[order], np.arange(len(names) + 1))
+    return names, order, bounds
+
+
+def _evenly_over_time(positions, datetimes, n):
+    # Sort the category by date (undated rows last) and pick n evenly spaced ranks
+    dates = datetimes[positions]
+    dated = positions[~np.isnat(dates)]
+    dated = dated[np.argsort(datetimes[dated], kind='stable')]
+    if len(dated) >= n:
+        return dated[np.linspace(0, len(dated) - 1, n).round().astype(np.int64)]
+    undated = positions[np.isnat(dates)]
+    return np.concatenate([dated, undated[:n - len(dated)]])
+
+
+def balance_indices(categories, target_size, strategy='last', seed=42, datetimes=None):
+    # Positions (into categories) of the balanced sample, grouped by category
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy {strategy!r}; expected one of {STRATEGIES}")
+    if strategy == 'time':
+        if datetimes is None:
+            raise ValueError("strategy='time' needs datetimes")
+        datetimes = np.asarray(datetimes, dtype='datetime64[ns]')
+
+    rng = np.random.default_rng(seed)
+    names, order, bounds = _category_groups(categories)
+    selected = []
+    for c in range(len(names)):
+        positions = order[bounds[c]:bounds[c + 1]]
+        if len(positions) <= target_size:
+            if strategy == 'oversample' and len(positions):
+                extra = rng.choice(positions, target_size - len(positions), replace=True)
+                positions = np.concatenate([positions, np.sort(extra)])
+            selected.append(positions)
+        elif strategy == 'last':
+            selected.append(positions[-target_size:])
+        elif strategy in ('random', 'oversample'):
+            selected.append(np.sort(rng.choice(positions, target_size, replace=False)))
+        else:
+            selected.append(_evenly_over_time(positions, datetimes, target_size))
+    if not selected:
+        return np.empty(0, dtype=np.int64)
+    return np.concatenate(selected).astype(np.int64)
+
+
+def shuffle_indices(indices, random_state=42):
+    # Same permutation as DataFrame.sample(frac=1, random_state=random_state)
+    n = len(indices)
+    return indices[np.random.RandomState(random_state).choice(n, n, replace=False)]
+
+
+def balance_frame(df, target_size, strategy='last', seed=42, datetimes=None, shuffle=True):
+    indices = balance_indices(df['category'], target_size, strategy, seed, datetimes)
+    if shuffle:
+        indices = shuffle_indices(indices, seed)
+    return df.take(indices).reset_index(drop=True)
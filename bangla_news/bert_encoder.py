@@ -0,0 +1,268 @@
+# bert_encoder.py
+import os
+import time
+import warnings
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import multiprocessing as mp
+
+import numpy as np
+import torch
+
+# ---------------------------
+# Length-bucketed dynamic batching
+# ---------------------------
+# Texts are tokenized once without padding, sorted by length and cut into
+# batches by a token budget (batch size x longest sequence), so a batch of
+# short articles holds many rows and a batch of long ones only a few. Every
+# batch is padded only to its own longest sequence and the embeddings are
+# written back in the original order.
+def tokenize_all(tokenizer, texts, max_length=256):
+    encoded = tokenizer(list(texts), truncation=True, max_length=max_length,
+                        padding=False, return_attention_mask=False, return_token_type_ids=False)
+    return encoded['input_ids']
+
+
+def length_batches(lengths, max_tokens=8192, max_batch=256):
+    # Index arrays into lengths, shortest sequences first. A batch grows until
+    # adding the next (longer) sequence would push rows x longest past
+    # max_tokens, or it reaches max_batch rows.
+    lengths = np.asarray(lengths)
+    order = np.argsort(lengths, kind='stable')
+    batches, start = [], 0
+    for end in range(1, len(order) + 1):
+        rows = end - start
+        if end < len(order):
+            longest_next = lengths[order[end]]
+            if (rows + 1) * longest_next <= max_tokens and rows < max_batch:
+                continue
+        batches.append(order[start:end])
+        start = end
+    return batches
+
+
+def padded_tokens(lengths, batches):
+    return int(sum(len(b) * lengths[b].max() for b in batches if len(b)))
+
+
+def fixed_batches(n, batch_size):
+    # The old corpus-order slicing, kept for the padding comparison
+    return [np.arange(i, min(i + batch_size, n)) for i in range(0, n, batch_size)]
+
+
+def _collate(input_ids, batch, pad_token_id):
+    rows = [input_ids[i] for i in batch]
+    width = max(len(r) for r in rows)
+    ids = np.full((len(rows), width), pad_token_id, dtype=np.int64)
+    mask = np.zeros((len(rows), width), dtype=np.int64)
+    for j, r in enumerate(rows):
+        ids[j, :len(r)] = r
+        mask[j, :len(r)] = 1
+    return {
+        'input_ids': torch.from_numpy(ids),
+        'attention_mask': torch.from_numpy(mask),
+        'token_type_ids': torch.zeros_like(torch.from_numpy(ids)),
+    }
+
+
+# ---------------------------
+# Pooling
+# ---------------------------
+POOLINGS = ['cls', 'mean', 'max']
+
+
+def pool_hidden(hidden, attention_mask, pooling='cls'):
+    # hidden (batch, seq, dim); padded positions are excluded from mean / max
+    if pooling == 'cls':
+        return hidden[:, 0, :]
+    mask = attention_mask.unsqueeze(-1).to(hidden.dtype)
+    if pooling == 'mean':
+        return (hidden * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1)
+    if pooling == 'max':
+        return hidden.masked_fill(mask == 0, float('-inf')).max(dim=1).values
+    raise ValueError(f"Unknown pooling {pooling!r}; expected one of {POOLINGS}")
+
+
+def encode_texts(model, tokenizer, texts, device='cpu', max_length=256, max_tokens=8192,
+                 max_batch=256, progress=None, baseline_batch_size=64, pooling='cls', out=None,
+                 dtype=np.float32):
+    # Returns (embeddings as an (n, hidden) array in input order, stats).
+    # With out (e.g. a writable np.memmap of shape (n, hidden)) every batch is
+    # written straight into it and nothing else is held in memory; otherwise
+    # a dtype array is allocated. stats also carries the padding the old fixed
+    # batch_size slicing would have needed for the same texts, for comparison.
+    input_ids = tokenize_all(tokenizer, texts, max_length)
+    lengths = np.fromiter((len(r) for r in input_ids), dtype=np.int64, count=len(input_ids))
+    batches = length_batches(lengths, max_tokens, max_batch)
+    pad_token_id = tokenizer.pad_token_id if tokenizer.pad_token_id is not None else 0
+
+    if out is None:
+        out = np.empty((len(texts), model.config.hidden_size), dtype=dtype)
+    model.to(device)
+    started = time.perf_counter()
+    for k, batch in enumerate(batches):
+        inputs = {name: t.to(device) for name, t in _collate(input_ids, batch, pad_token_id).items()}
+        with torch.no_grad():
+            outputs = model(**inputs)
+            pooled = pool_hidden(outputs.last_hidden_state, inputs['attention_mask'], pooling)
+        out[batch] = pooled.float().cpu().numpy()  # cast to out.dtype on assignment
+        if progress is not None:
+            progress(k + 1, len(batches))
+    seconds = time.perf_counter() - started
+
+    real = int(lengths.sum())
+    padded = padded_tokens(lengths, batches)
+    fixed_padded = padded_tokens(lengths, fixed_batches(len(lengths), baseline_batch_size))
+    stats = {
+        'sequences': len(texts),
+        'batches': len(batches),
+        'real_tokens': real,
+        'padded_tokens': padded,
+        'padding_efficiency': real / padded if padded else 1.0,
+        'fixed_padded_tokens': fixed_padded,
+        'fixed_padding_efficiency': real / fixed_padded if fixed_padded else 1.0,
+        'seconds': seconds,
+        'tokens_per_second': real / seconds if seconds else 0.0,
+        'sequences_per_second': len(texts) / seconds if seconds else 0.0,
+    }
+    return out, stats
+
+
+def merge_stats(a, b):
+    # Sum the counters of two encode_texts runs and recompute the ratios
+    if not a:
+        return dict(b)
+    merged = {k: a[k] + b[k] for k in ('sequences', 'batches', 'real_tokens', 'padded_tokens',
+                                       'fixed_padded_tokens', 'seconds')}
+    for padded, ratio in (('padded_tokens', 'padding_efficiency'), ('fixed_padded_tokens', 'fixed_padding_efficiency')):
+        merged[ratio] = merged['real_tokens'] / merged[padded] if merged[padded] else 1.0
+    merged['tokens_per_second'] = merged['real_tokens'] / merged['seconds'] if merged['seconds'] else 0.0
+    merged['sequences_per_second'] = merged['sequences'] / merged['seconds'] if merged['seconds'] else 0.0
+    return merged
+
+
+# ---------------------------
+# CPU inference mode: int8 dynamic quantization
+# ---------------------------
+# quantize_dynamic swaps every nn.Linear for an int8-weight version that
+# quantizes activations on the fly; embeddings and layer norms stay fp32.
+def quantize_model(model):
+    with warnings.catch_warnings():
+        # torch.ao.quantization is deprecated in favour of torchao but still
+        # ships with torch and needs no extra dependency
+        warnings.simplefilter('ignore')
+        return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def load_encoder(model_name, quantize=False, threads=None):
+    from transformers import AutoModel, AutoTokenizer
+    if threads:
+        torch.set_num_threads(threads)
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModel.from_pretrained(model_name)
+    model.eval()
+    if quantize:
+        model = quantize_model(model)
+    return tokenizer, model
+
+
+def compare_encoders(reference, candidate, tokenizer, texts, max_length=256, max_tokens=8192, pooling='cls'):
+    # Accuracy check of a quantized model against fp32 on a sample of texts,
+    # comparing the pooled vectors (CLS, mean or max) of both
+    a, _ = encode_texts(reference, tokenizer, texts, max_length=max_length, max_tokens=max_tokens, pooling=pooling)
+    b, _ = encode_texts(candidate, tokenizer, texts, max_length=max_length, max_tokens=max_tokens, pooling=pooling)
+    cosine = (a * b).sum(axis=1) / np.maximum(np.linalg.norm(a, axis=1) * np.linalg.norm(b, axis=1), 1e-12)
+    return {
+        'samples': len(texts),
+        'mean_cosine': float(cosine.mean()) if len(cosine) else 1.0,
+        'min_cosine': float(cosine.min()) if len(cosine) else 1.0,
+        'max_abs_diff': float(np.abs(a - b).max()) if len(a) else 0.0,
+    }
+
+
+def save_random_bert(path, words, seed=0, **config):
+    # Small randomly initialised BERT plus a word-level vocab, written with
+    # save_pretrained so it loads like any hub model (no download needed)
+    from transformers import BertConfig, BertModel, BertTokenizerFast
+    os.makedirs(path, exist_ok=True)
+    vocab = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"] + [w for w in words if not w.startswith("[")]
+    vocab_file = os.path.join(path, "vocab.txt")
+    with open(vocab_file, "w", encoding="utf-8") as f:
+        f.write("\n".join(vocab))
+    settings = dict(hidden_size=64, num_hidden_layers=2, num_attention_heads=4,
+                    intermediate_size=128, max_position_embeddings=512)
+    settings.update(config)
+    torch.manual_seed(seed)
+    BertModel(BertConfig(vocab_size=len(vocab), **settings)).save_pretrained(path)
+    BertTokenizerFast(vocab_file, do_lower_case=False).save_pretrained(path)
+    return path
+
+
+# ---------------------------
+# CPU inference mode: sharded multi-process encoding
+# ---------------------------
+# Each worker process loads its own model copy (optionally quantized) and is
+# pinned to threads_per_worker intra-op threads, so workers x threads does not
+# oversubscribe the cores. Shards are contiguous slices of the input and are
+# length-bucketed inside the worker. Starting the workers (spawn, import torch,
+# load and quantize the model) costs far more than a chunk of texts, so a
+# caller encoding many chunks opens one encoder_pool and passes it to every
+# encode_sharded call.
+_worker_encoder = None
+
+
+def _init_encoder_worker(model_name, quantize, threads):
+    global _worker_encoder
+    torch.set_num_threads(threads)
+    torch.set_num_interop_threads(1)
+    _worker_encoder = load_encoder(model_name, quantize=quantize)
+
+
+def _encode_shard(texts, max_length, max_tokens, pooling, dtype):
+    tokenizer, model = _worker_encoder
+    return encode_texts(model, tokenizer, texts, max_length=max_length, max_tokens=max_tokens,
+                        pooling=pooling, dtype=dtype)
+
+
+def encoder_pool(model_name, workers=2, threads_per_worker=None, quantize=False):
+    threads_per_worker = threads_per_worker or max(1, (os.cpu_count() or 1) // workers)
+    return ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context('spawn'),
+                               initializer=_init_encoder_worker,
+                               initargs=(model_name, quantize, threads_per_worker))
+
+
+def encode_sharded(model_name, texts, workers=2, threads_per_worker=None, quantize=False,
+                   max_length=256, max_tokens=8192, progress=None, pooling='cls', out=None,
+                   dtype=np.float32, pool=None):
+    # Same contract as encode_texts; each finished shard is copied into out
+    # (when given) and dropped, so only the shards in flight are in memory.
+    # Without a pool, one is started (and shut down) for this call only.
+    texts = list(texts)
+    shard_size = max(1, -(-len(texts) // (workers * 4)))  # a few shards per worker to balance load
+    shards = [texts[i:i + shard_size] for i in range(0, len(texts), shard_size)]
+
+    stats = {}
+    started = time.perf_counter()
+    owned = encoder_pool(model_name, workers, threads_per_worker, quantize) if pool is None else None
+    with owned or nullcontext(pool) as pool:
+        futures = {pool.submit(_encode_shard, shard, max_length, max_tokens, pooling, dtype): k
+                   for k, shard in enumerate(shards)}
+        for done, future in enumerate(as_completed(futures), start=1):
+            embeddings, shard_stats = future.result()
+            if out is None:
+                out = np.empty((len(texts), embeddings.shape[1]), dtype=dtype)
+            start = futures[future] * shard_size
+            out[start:start + len(embeddings)] = embeddings
+            stats = merge_stats(stats, shard_stats)
+            if progress is not None:
+                progress(done, len(shards))
+
+    if not stats:
+        return np.empty((0, 0), dtype=dtype) if out is None else out, stats
+    # Shard times overlap, so throughput is over wall time (including model
+    # loading when the pool was started for this call)
+    stats['worker_seconds'] = stats['seconds']
+    stats['seconds'] = time.perf_counter() - started
+    stats['tokens_per_second'] = stats['real_tokens'] / stats['seconds']
+    stats['sequences_per_second'] = stats['sequences'] / stats['seconds']
+    return out, stats
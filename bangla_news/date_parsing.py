@@ -0,0 +1,122 @@
+# date_parsing.py
+import re
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# ------------------ Bangla date parsing ------------------
+BN_MONTHS = {
+    "জানুয়ারি": 1, "ফেব্রুয়ারি": 2, "মার্চ": 3, "এপ্রিল": 4, "মে": 5, "জুন": 6,
+    "জুলাই": 7, "আগস্ট": 8, "সেপ্টেম্বর": 9, "অক্টোবর": 10, "নভেম্বর": 11, "ডিসেম্বর": 12
+}
+# Alternative spellings seen in the data ("আগষ্ট" is also the spelling in
+# the stopword list)
+BN_MONTH_ALIASES = {"আগষ্ট": 8}
+BN_MONTH_LOOKUP = {**BN_MONTHS, **BN_MONTH_ALIASES}
+BN_DIGITS = str.maketrans("০১২৩৪৫৬৭৮৯", "0123456789")
+
+LEADING_NON_DIGITS = re.compile(r"^[^\d\u09E6-\u09EF]+")
+PATTERN1 = re.compile(r"(?P<day>\d{1,2})\s+(?P<month>[^\s]+)\s+(?P<year>\d{4})(?:,\s*(?P<time>\d{1,2}:\d{2}))?")
+PATTERN2 = re.compile(r"(?P<time>\d{1,2}:\d{2}),\s*(?P<day>\d{1,2})\s+(?P<month>[^\s]+)\s+(?P<year>\d{4})")
+
+
+def parse_bangla_date(date_str: str):
+    if not isinstance(date_str, str):
+        return None
+    cleaned = LEADING_NON_DIGITS.sub("", date_str.strip())
+    cleaned = cleaned.translate(BN_DIGITS)
+    match = PATTERN1.search(cleaned) or PATTERN2.search(cleaned)
+    if not match: return None
+    gd = match.groupdict()
+    day = int(gd["day"])
+    month = BN_MONTH_LOOKUP.get(gd["month"], None)
+    year = int(gd["year"])
+    if month is None: return None
+    time_part = gd.get("time") or "00:00"
+    try:
+        return datetime.strptime(f"{day:02d}-{month:02d}-{year} {time_part}", "%d-%m-%Y %H:%M")
+    except ValueError:
+        return None
+
+
+# ---------------------------
+# Bulk parser
+# ---------------------------
+# Parses every distinct published_date string once, column-wise, and maps the
+# results back to the rows through the factorize codes. Returns a
+# datetime64[ns] Series and a report with:
+#   'unparsed'  one row per distinct unparsed value, with row count and reason
+#   'months'    every month spelling seen, with row count and whether it maps
+#               to a month (shows the "আগষ্ট" / "আগস্ট" split)
+# Dates outside the datetime64[ns] range (pd.Timestamp.min/max) are reported
+# as unparsed instead of wrapping around.
+def parse_bangla_dates(values):
+    values = pd.Series(values)
+    codes, uniques = pd.factorize(values.to_numpy(dtype=object), use_na_sentinel=True)
+    rows_per_value = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    if not len(uniques):  # empty or all-null input
+        datetimes = pd.Series(np.full(len(values), np.datetime64('NaT'), dtype='datetime64[ns]'),
+                              index=values.index, name='datetime')
+        unparsed = pd.DataFrame({'published_date': pd.Series(dtype=object), 'rows': pd.Series(dtype=np.int64),
+                                 'reason': pd.Series(dtype=object)})
+        months = pd.DataFrame({'month_token': pd.Series(dtype=object), 'rows': pd.Series(dtype=np.int64),
+                               'month': pd.Series(dtype='Int64'), 'spelling': pd.Series(dtype=object)})
+        return datetimes, {'unparsed': unparsed, 'months': months}
+
+    raw = pd.Series(uniques, dtype=object)
+    is_text = np.fromiter((isinstance(v, str) for v in uniques), dtype=bool, count=len(uniques))
+    cleaned = (raw.where(is_text).str.strip()
+               .str.replace(LEADING_NON_DIGITS, "", regex=True)
+               .str.translate(BN_DIGITS))
+
+    # pattern1 wins wherever it matches, like `pattern1.search(...) or pattern2.search(...)`
+    parts = cleaned.str.extract(PATTERN2)[['day', 'month', 'year', 'time']]
+    first = cleaned.str.extract(PATTERN1)
+    use_first = first['day'].notna()
+    parts.loc[use_first] = first.loc[use_first, ['day', 'month', 'year', 'time']]
+    matched = parts['day'].notna()
+
+    month = parts['month'].map(BN_MONTH_LOOKUP)
+    time = parts['time'].fillna("00:00").str.split(":", n=1, expand=True)
+    components = pd.DataFrame({
+        'year': pd.to_numeric(parts['year'], errors='coerce'),
+        'month': month,
+        'day': pd.to_numeric(parts['day'], errors='coerce'),
+        'hour': pd.to_numeric(time[0], errors='coerce'),
+        'minute': pd.to_numeric(time[1], errors='coerce'),
+    })
+    valid_time = (components['hour'] <= 23) & (components['minute'] <= 59)
+    parsed = pd.to_datetime(components[matched & month.notna() & valid_time], errors='coerce')
+    out_of_range = parsed.notna() & ~parsed.between(pd.Timestamp.min, pd.Timestamp.max)
+    parsed = parsed.mask(out_of_range)
+    parsed_unique = parsed.reindex(raw.index).to_numpy(dtype='datetime64[ns]')
+
+    result = np.full(len(values), np.datetime64('NaT'), dtype='datetime64[ns]')
+    has_value = codes >= 0
+    result[has_value] = parsed_unique[codes[has_value]]
+    datetimes = pd.Series(result, index=values.index, name='datetime')
+
+    # ---------------------------
+    # Report
+    # ---------------------------
+    reason = pd.Series("invalid date/time", index=raw.index, dtype=object)
+    reason[out_of_range.reindex(raw.index, fill_value=False)] = "year out of range"
+    reason[matched & month.isna()] = "unknown month: " + parts['month'][matched & month.isna()]
+    reason[~matched] = "no date pattern"
+    reason[~is_text] = "not a string"
+    failed = np.isnat(parsed_unique)
+    unparsed = pd.DataFrame({
+        'published_date': raw[failed],
+        'rows': rows_per_value[failed],
+        'reason': reason[failed],
+    }).sort_values('rows', ascending=False, kind='stable').reset_index(drop=True)
+
+    months = (pd.DataFrame({'month_token': parts['month'][matched], 'rows': rows_per_value[matched.to_numpy()]})
+              .groupby('month_token', as_index=False)['rows'].sum())
+    months['month'] = months['month_token'].map(BN_MONTH_LOOKUP).astype('Int64')
+    months['spelling'] = np.where(months['month_token'].isin(list(BN_MONTHS)), "canonical",
+                                  np.where(months['month_token'].isin(list(BN_MONTH_ALIASES)), "alias", "unknown"))
+    months = months.sort_values('rows', ascending=False, kind='stable').reset_index(drop=True)
+
+    return datetimes, {'unparsed': unparsed, 'months': months}
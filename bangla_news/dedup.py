@@ -0,0 +1,233 @@
+# dedup.py
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import numpy as np
+import pandas as pd
+
+# ---------------------------
+# Deduplication over the combined corpus
+# ---------------------------
+# Three rules, applied in order; every removed row points at the row it
+# duplicates (always an earlier row, like drop_duplicates(keep='first')):
+#
+#   exact          identical raw content (64-bit hash)
+#   normalized     identical after NFC, lower-casing, punctuation removal
+#                  and whitespace collapsing (64-bit hash)
+#   near           estimated Jaccard similarity of word shingles >= threshold
+#                  (MinHash signatures, candidate pairs from LSH banding)
+#
+# Hashing replaces comparisons of full article strings, and the MinHash
+# signatures are computed in parallel chunks.
+PUNCTUATION = '!"#$%&\'()*+,-./:;<=>?@[\\]^_`{|}~।॥‘’“”—–…'
+SEPARATORS = re.compile('[' + re.escape(PUNCTUATION) + r'\s]+')
+_MIX = np.uint64(0x100000001B3)
+
+
+def normalize_content(texts):
+    texts = pd.Series(texts, dtype=object)
+    texts = texts.where(texts.map(type).eq(str), '')
+    # Punctuation and whitespace runs become one space in a single regex pass
+    return texts.str.normalize("NFC").str.lower().str.replace(SEPARATORS, ' ', regex=True).str.strip()
+
+
+def content_hashes(texts):
+    # uint64 per text; deterministic across processes and runs
+    return pd.util.hash_array(pd.Series(texts, dtype=object).fillna('').to_numpy(dtype=object))
+
+
+def first_occurrence(hashes):
+    # Row of the first occurrence of each row's hash
+    codes, uniques = pd.factorize(hashes)
+    first = np.full(len(uniques), len(hashes), dtype=np.int64)
+    np.minimum.at(first, codes, np.arange(len(hashes)))
+    return first[codes]
+
+
+def exact_duplicates(texts):
+    # Hash-based drop_duplicates(keep='first') mask: True for repeated rows
+    return first_occurrence(content_hashes(texts)) != np.arange(len(texts))
+
+
+# ---------------------------
+# MinHash signatures
+# ---------------------------
+# Shingles are k consecutive words; each word is hashed once and a shingle
+# key mixes its word hashes. Permutation i is the multiply-shift hash
+# ((a_i * x + b_i) mod 2**64) >> 32 with odd a_i.
+def minhash_params(num_perm=128, seed=1):
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, 2**63, num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+    b = rng.integers(0, 2**63, num_perm, dtype=np.uint64)
+    return a, b
+
+
+def _shingle_keys(normalized, k):
+    tokens = [t.split() for t in normalized]
+    lengths = np.fromiter((len(t) for t in tokens), dtype=np.int64, count=len(tokens))
+    offsets = np.zeros(len(tokens) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    flat = np.empty(int(offsets[-1]), dtype=object)
+    flat[:] = [w for t in tokens for w in t]
+    word_hashes = pd.util.hash_array(flat) if len(flat) else np.empty(0, dtype=np.uint64)
+
+    # A shingle starting at i is valid if it ends inside the same document
+    n_starts = max(len(flat) - k + 1, 0)
+    doc_end = np.repeat(offsets[1:], lengths)[:n_starts]
+    starts = np.flatnonzero(doc_end >= np.arange(k, k + n_starts))
+    keys = word_hashes[starts]
+    with np.errstate(over='ignore'):
+        for j in range(1, k):
+            keys = keys * _MIX ^ word_hashes[starts + j]
+    doc_of_shingle = np.searchsorted(offsets, starts, side='right') - 1
+
+    # Documents shorter than k words get one shingle: the whole text
+    short = np.flatnonzero((lengths > 0) & (lengths < k))
+    if len(short):
+        keys = np.concatenate([keys, content_hashes(np.asarray(normalized, dtype=object)[short])])
+        doc_of_shingle = np.concatenate([doc_of_shingle, short])
+    return keys, doc_of_shingle
+
+
+def minhash_signatures(normalized, k=5, num_perm=128, seed=1, max_cells=8_000_000):
+    # (n_docs, num_perm) uint32; documents without words get all 0xFFFFFFFF
+    a, b = minhash_params(num_perm, seed)
+    keys, doc_of_shingle = _shingle_keys(list(normalized), k)
+    order = np.argsort(doc_of_shingle, kind='stable')
+    keys, doc_of_shingle = keys[order], doc_of_shingle[order]
+
+    signatures = np.full((len(normalized), num_perm), np.iinfo(np.uint32).max, dtype=np.uint32)
+    step = max(1, max_cells // num_perm)  # bounds the (shingles x perms) block
+    with np.errstate(over='ignore'):
+        for lo in range(0, len(keys), step):
+            block_keys, block_docs = keys[lo:lo + step], doc_of_shingle[lo:lo + step]
+            hashed = ((block_keys[:, None] * a[None, :] + b[None, :]) >> np.uint64(32)).astype(np.uint32)
+            starts = np.flatnonzero(np.r_[True, block_docs[1:] != block_docs[:-1]])
+            docs = block_docs[starts]
+            # A document can straddle two blocks, so merge with what is there
+            signatures[docs] = np.minimum(signatures[docs], np.minimum.reduceat(hashed, starts, axis=0))
+    return signatures
+
+
+def _signature_worker(args):
+    texts, k, num_perm, seed = args
+    return minhash_signatures(texts, k, num_perm, seed)
+
+
+def parallel_signatures(normalized, k=5, num_perm=128, seed=1, workers=None, chunk_size=5000):
+    values = list(normalized)
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(values) <= chunk_size:
+        return minhash_signatures(values, k, num_perm, seed)
+    chunks = [(values[i:i + chunk_size], k, num_perm, seed) for i in range(0, len(values), chunk_size)]
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), mp_context=get_context('spawn')) as pool:
+        return np.concatenate(list(pool.map(_signature_worker, chunks)))
+
+
+# ---------------------------
+# LSH banding
+# ---------------------------
+def choose_bands(num_perm, threshold):
+    # (bands, rows) with bands * rows == num_perm whose S-curve midpoint
+    # (1 / bands) ** (1 / rows) sits a little below threshold, so few true
+    # pairs are missed; candidates are verified against threshold afterwards
+    target = max(threshold - 0.1, 0.05)
+    options = [(b, num_perm // b) for b in range(1, num_perm + 1) if num_perm % b == 0]
+    return min(options, key=lambda br: abs((1 / br[0]) ** (1 / br[1]) - target))
+
+
+def lsh_candidates(signatures, bands, rows, max_bucket=100):
+    # Unique (i, j), i < j, of rows that share at least one band. Buckets
+    # larger than max_bucket (boilerplate) are chained instead of fully paired.
+    pairs = []
+    valid = np.flatnonzero(signatures[:, 0] != np.iinfo(np.uint32).max)
+    with np.errstate(over='ignore'):
+        for band in range(bands):
+            h = np.zeros(len(valid), dtype=np.uint64)
+            for col in signatures[valid, band * rows:(band + 1) * rows].T:
+                h = h * _MIX ^ col.astype(np.uint64)
+            order = np.argsort(h, kind='stable')
+            sorted_h = h[order]
+            starts = np.flatnonzero(np.r_[True, sorted_h[1:] != sorted_h[:-1]])
+            sizes = np.diff(np.r_[starts, len(order)])
+            for start, size in zip(starts[sizes > 1], sizes[sizes > 1]):
+                members = np.sort(valid[order[start:start + size]])
+                if size <= max_bucket:
+                    i, j = np.triu_indices(size, 1)
+                    pairs.append(np.stack([members[i], members[j]], axis=1))
+                else:
+                    pairs.append(np.stack([members[:-1], members[1:]], axis=1))
+    if not pairs:
+        return np.empty((0, 2), dtype=np.int64)
+    return np.unique(np.concatenate(pairs), axis=0)
+
+
+def estimated_jaccard(signatures, pairs, chunk=200_000):
+    result = np.empty(len(pairs), dtype=np.float32)
+    for lo in range(0, len(pairs), chunk):
+        p = pairs[lo:lo + chunk]
+        result[lo:lo + chunk] = (signatures[p[:, 0]] == signatures[p[:, 1]]).mean(axis=1)
+    return result
+
+
+# ---------------------------
+# Full pipeline
+# ---------------------------
+def find_duplicates(texts, threshold=0.8, k=5, num_perm=128, workers=None, groups=None):
+    # Returns (keep mask, per-row DataFrame with rule / duplicate_of / similarity
+    # for removed rows, summary report). groups (e.g. which dataset a row came
+    # from) only feeds the cross-group column of the report.
+    texts = pd.Series(texts, dtype=object).reset_index(drop=True)
+    n = len(texts)
+    rule = np.full(n, None, dtype=object)
+    duplicate_of = np.full(n, -1, dtype=np.int64)
+    similarity = np.full(n, np.nan, dtype=np.float32)
+
+    first = first_occurrence(content_hashes(texts))
+    hit = first != np.arange(n)
+    rule[hit], duplicate_of[hit], similarity[hit] = 'exact', first[hit], 1.0
+
+    remaining = np.flatnonzero(~hit)
+    normalized = normalize_content(texts.iloc[remaining]).to_numpy(dtype=object)
+    first = remaining[first_occurrence(content_hashes(normalized))]
+    hit = first != remaining
+    rule[remaining[hit]], duplicate_of[remaining[hit]], similarity[remaining[hit]] = 'normalized', first[hit], 1.0
+
+    keep_norm = ~hit
+    remaining, normalized = remaining[keep_norm], normalized[keep_norm]
+    if len(remaining) > 1 and threshold < 1.0:
+        signatures = parallel_signatures(normalized, k, num_perm, workers=workers)
+        bands, rows = choose_bands(num_perm, threshold)
+        pairs = lsh_candidates(signatures, bands, rows)
+        scores = estimated_jaccard(signatures, pairs)
+        pairs, scores = pairs[scores >= threshold], scores[scores >= threshold]
+
+        # Greedy pass in row order: a row goes if a kept earlier row is a
+        # near-duplicate of it (the most similar one is reported), so every
+        # removed row is within the threshold of the row it points at
+        order = np.lexsort((-scores, pairs[:, 1]))
+        kept = np.ones(len(remaining), dtype=bool)
+        for (i, j), score in zip(pairs[order].tolist(), scores[order].tolist()):
+            if kept[j] and kept[i]:
+                kept[j] = False
+                rule[remaining[j]], duplicate_of[remaining[j]] = 'near', remaining[i]
+                similarity[remaining[j]] = score
+
+    removed = pd.DataFrame({'rule': rule, 'duplicate_of': duplicate_of, 'similarity': similarity})
+    removed = removed[removed['rule'].notna()]
+
+    report = removed.groupby('rule', sort=False).size().reindex(['exact', 'normalized', 'near'], fill_value=0)
+    report = report.rename('rows_removed').to_frame()
+    if groups is not None:
+        groups = np.asarray(groups)
+        cross = groups[removed.index.to_numpy()] != groups[removed['duplicate_of'].to_numpy()]
+        report['cross_dataset'] = pd.Series(cross, index=removed['rule'].to_numpy()).groupby(level=0).sum() \
+            .reindex(report.index, fill_value=0).astype(int)
+    report.index.name = 'rule'
+    report = report.reset_index()
+
+    keep = np.ones(n, dtype=bool)
+    keep[removed.index.to_numpy()] = False
+    return keep, removed, report
@@ -0,0 +1,69 @@
+# dedup_check.py
+import argparse
+import random
+import sys
+
+import numpy as np
+import pandas as pd
+
+from .dedup import estimated_jaccard, find_duplicates, minhash_signatures, normalize_content
+from .encoder_check import WORDS
+
+# ---------------------------
+# Deduplication self-check
+# ---------------------------
+# python -m bangla_news.dedup_check
+#
+# Builds drift chains: each article differs from the one before it by a few
+# replaced words, so neighbours are near-duplicates while the ends of a chain
+# are not. For every threshold it checks the near rule:
+#
+#   similarity    no removed row has similarity < threshold, recomputed
+#                 against the row it is reported as a duplicate of
+#   kept          no removed row points at a row that was itself removed
+#   drift         the first article of each chain is kept and rows far down
+#                 a chain are not removed as duplicates of it
+#
+# Exits with status 1 if a check fails.
+def drift_chains(n_chains=20, length=12, words=200, edits=8, seed=0):
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(n_chains):
+        article = [rng.choice(WORDS) + str(rng.randrange(1000)) for _ in range(words)]
+        for _ in range(length):
+            texts.append(" ".join(article))
+            article = list(article)
+            for position in rng.sample(range(words), edits):
+                article[position] = rng.choice(WORDS) + str(rng.randrange(1000))
+    return pd.Series(texts)
+
+
+def run_checks(thresholds=(0.5, 0.6, 0.7, 0.8, 0.9), length=12):
+    texts = drift_chains(length=length)
+    signatures = minhash_signatures(normalize_content(texts))
+    rows = []
+    for threshold in thresholds:
+        keep, removed, _ = find_duplicates(texts, threshold=threshold, workers=1)
+        near = removed[removed['rule'] == 'near']
+        pairs = np.stack([near['duplicate_of'].to_numpy(), near.index.to_numpy()], axis=1)
+        recomputed = estimated_jaccard(signatures, pairs)
+        below = int((recomputed < threshold).sum())
+        ok = below == 0 and np.allclose(recomputed, near['similarity'].to_numpy())
+        rows.append((threshold, 'similarity', f"{len(near)} removed, {below} below threshold", ok))
+        dangling = int((~keep[near['duplicate_of'].to_numpy()]).sum())
+        rows.append((threshold, 'kept', f"{dangling} point at removed rows", dangling == 0))
+        heads = np.arange(0, len(texts), length)
+        far = near.index.to_numpy() % length >= length // 2
+        far_of_head = int(np.isin(near['duplicate_of'].to_numpy()[far], heads).sum())
+        ok = keep[heads].all() and far_of_head == 0
+        rows.append((threshold, 'drift', f"{far_of_head} far rows removed as duplicates of a chain head", ok))
+    return pd.DataFrame(rows, columns=['threshold', 'check', 'value', 'ok'])
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Check near-duplicate removal on synthetic drift chains")
+    parser.add_argument('--length', type=int, default=12)
+    args = parser.parse_args()
+    report = run_checks(length=args.length)
+    print(report.to_string(index=False))
+    sys.exit(0 if report['ok'].all() else 1)
@@ -0,0 +1,174 @@
+# embedding_store.py
+import hashlib
+import json
+import os
+import re
+import threading
+
+import numpy as np
+
+# ---------------------------
+# Persistent embedding store
+# ---------------------------
+# One directory per model under root:
+#
+#   vectors.bin   raw (rows, dim) matrix, filled batch by batch through a
+#                 writable memmap over space reserved at the end of the file
+#   keys.bin      raw 16-byte key per row, same order as vectors.bin
+#   meta.json     model name, dim, dtype and the number of committed rows
+#
+# A key is a blake2b hash of the model name and the article text, so the same
+# text encoded by another model never collides. A batch is committed by
+# flushing its vectors, appending its keys and then rewriting meta.json atomically;
+# anything past the committed row count (an interrupted batch) is truncated
+# on open, so a killed run resumes from its last completed batch.
+KEY_BYTES = 16
+
+
+def content_key(text, model_name):
+    h = hashlib.blake2b(digest_size=KEY_BYTES)
+    h.update(model_name.encode())
+    h.update(b"\0")
+    h.update(text.encode() if isinstance(text, str) else b"")
+    return h.digest()
+
+
+def _model_dir(root, model_name):
+    return os.path.join(root, re.sub(r"[^\w.-]+", "__", model_name))
+
+
+class EmbeddingStore:
+    def __init__(self, model_name, dim, root=".embeddings", dtype="float32"):
+        self.model_name = model_name
+        self.dim = int(dim)
+        self.dtype = np.dtype(dtype)
+        self.path = _model_dir(root, model_name)
+        self._lock = threading.Lock()
+        self._encode_lock = threading.Lock()  # one encode_missing at a time (reserve/commit pairs)
+        os.makedirs(self.path, exist_ok=True)
+
+        meta = self._read_meta()
+        if meta is not None and (meta['dim'] != self.dim or meta['dtype'] != self.dtype.name):
+            raise ValueError(
+                f"Embedding store at {self.path} holds dim={meta['dim']} {meta['dtype']}, "
+                f"requested dim={self.dim} {self.dtype.name}"
+            )
+        self.rows = meta['rows'] if meta is not None else 0
+        self._truncate_to(self.rows)
+        self._write_meta()
+
+        keys = np.fromfile(self._file('keys.bin'), dtype=f"S{KEY_BYTES}", count=self.rows)
+        self._index = {k: i for i, k in enumerate(keys.tolist())}
+
+    # ---------------------------
+    # Files
+    # ---------------------------
+    def _file(self, name):
+        return os.path.join(self.path, name)
+
+    @property
+    def row_bytes(self):
+        return self.dim * self.dtype.itemsize
+
+    def _read_meta(self):
+        try:
+            with open(self._file('meta.json')) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def _write_meta(self):
+        tmp = self._file('meta.json.tmp')
+        with open(tmp, 'w') as f:
+            json.dump({'model_name': self.model_name, 'dim': self.dim,
+                       'dtype': self.dtype.name, 'rows': self.rows}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self._file('meta.json'))
+
+    def _truncate_to(self, rows):
+        for name, width in (('vectors.bin', self.row_bytes), ('keys.bin', KEY_BYTES)):
+            with open(self._file(name), 'ab') as f:
+                if f.tell() != rows * width:
+                    f.truncate(rows * width)
+
+    @property
+    def nbytes(self):
+        return self.rows * (self.row_bytes + KEY_BYTES)
+
+    # ---------------------------
+    # Lookup / reserve / commit
+    # ---------------------------
+    def keys_for(self, texts):
+        return [content_key(t, self.model_name) for t in texts]
+
+    def lookup(self, keys):
+        # Row of each key in the matrix, -1 where it has not been encoded yet
+        index = self._index
+        return np.fromiter((index.get(k, -1) for k in keys), dtype=np.int64, count=len(keys))
+
+    def reserve(self, n):
+        # Writable memmap over n new rows at the end of vectors.bin. The rows
+        # only become part of the store once commit() is called with their keys.
+        with self._lock:
+            with open(self._file('vectors.bin'), 'ab') as f:
+                f.truncate((self.rows + n) * self.row_bytes)
+        if n == 0:
+            return np.empty((0, self.dim), dtype=self.dtype)
+        return np.memmap(self._file('vectors.bin'), dtype=self.dtype, mode='r+',
+                         offset=self.rows * self.row_bytes, shape=(n, self.dim))
+
+    def commit(self, keys, reserved):
+        # Keys must be new and match the rows of the last reserve() in order
+        with self._lock:
+            if isinstance(reserved, np.memmap):
+                reserved.flush()
+            with open(self._file('keys.bin'), 'ab') as f:
+                f.write(b"".join(keys))
+                f.flush()
+                os.fsync(f.fileno())
+            for k in keys:
+                self._index[k] = len(self._index)
+            self.rows = len(self._index)
+            self._write_meta()
+
+    # ---------------------------
+    # Zero-copy access
+    # ---------------------------
+    def matrix(self):
+        # Read-only memmap over every committed row
+        if self.rows == 0:
+            return np.empty((0, self.dim), dtype=self.dtype)
+        return np.memmap(self._file('vectors.bin'), dtype=self.dtype, mode='r', shape=(self.rows, self.dim))
+
+    # ---------------------------
+    # Incremental encoding
+    # ---------------------------
+    def encode_missing(self, texts, encode_fn, batch_size=64, progress=None):
+        # Encodes only the texts whose key is not in the store yet, one batch
+        # at a time, committing after every batch. encode_fn(list_of_texts, out)
+        # writes the (n, dim) embeddings into out, a memmap over the reserved
+        # rows, so peak memory does not grow with the corpus. progress(done,
+        # total) is called after each batch. Returns the store row of every
+        # input text and the number of texts that had to be encoded.
+        with self._encode_lock:
+            return self._encode_missing(texts, encode_fn, batch_size, progress)
+
+    def _encode_missing(self, texts, encode_fn, batch_size, progress):
+        keys = self.keys_for(texts)
+        rows = self.lookup(keys)
+        missing = {}
+        for i in np.flatnonzero(rows < 0):
+            missing.setdefault(keys[i], i)  # duplicate texts are encoded once
+        todo = list(missing.values())
+
+        for start in range(0, len(todo), batch_size):
+            batch = todo[start:start + batch_size]
+            reserved = self.reserve(len(batch))
+            encode_fn([texts[i] for i in batch], reserved)
+            self.commit([keys[i] for i in batch], reserved)
+            del reserved
+            if progress is not None:
+                progress(min(start + batch_size, len(todo)), len(todo))
+
+        return self.lookup(keys), len(todo)
@@ -0,0 +1,84 @@
+# encoder_check.py
+import argparse
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from .bert_encoder import (compare_encoders, encode_sharded, encode_texts, encoder_pool, load_encoder,
+                           quantize_model, save_random_bert)
+
+# ---------------------------
+# Encoder self-check
+# ---------------------------
+# python -m bangla_news.encoder_check
+#
+# Builds a small random BERT with save_random_bert (no download), encodes a
+# synthetic Bangla corpus and checks the CPU inference paths against plain
+# fp32 encoding:
+#
+#   bucketing   token budgets of 512 and 65536 give the same vectors
+#               (padding does not leak into the pooled output)
+#   int8        quantize_model + compare_encoders, mean CLS cosine against fp32
+#   sharded     encode_sharded over one shared encoder_pool, chunk by chunk
+#               as EmbeddingStore.encode_missing calls it, against
+#               encode_texts; also the time of starting a pool per chunk
+#
+# Exits with status 1 if a check fails.
+WORDS = ['বাংলাদেশ', 'সরকার', 'খেলা', 'দল', 'ম্যাচ', 'বাজার', 'দাম', 'টাকা', 'স্বাস্থ্য', 'হাসপাতাল', 'রোগী',
+         'শিক্ষা', 'পরীক্ষা', 'ছাত্র', 'চলচ্চিত্র', 'গান', 'শিল্পী', 'পুলিশ', 'মামলা', 'আদালত', 'প্রযুক্তি',
+         'মোবাইল', 'ইন্টারনেট', 'পরিবেশ', 'নদী', 'বৃষ্টি', 'খাবার', 'পোশাক', 'ভ্রমণ', 'ঢাকা']
+
+
+def synthetic_texts(n, seed=0, max_words=120):
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(WORDS) for _ in range(rng.randint(3, max_words))) for _ in range(n)]
+
+
+def _max_diff(a, b):
+    return float(np.abs(np.asarray(a, dtype=np.float32) - np.asarray(b, dtype=np.float32)).max())
+
+
+def run_checks(n_texts=400, workers=2, chunk_size=100, tolerance=1e-4, min_cosine=0.95):
+    texts = synthetic_texts(n_texts)
+    rows = []
+    with tempfile.TemporaryDirectory() as path:
+        save_random_bert(path, WORDS)
+        tokenizer, model = load_encoder(path)
+
+        reference, _ = encode_texts(model, tokenizer, texts, max_tokens=65536)
+        small_batches, _ = encode_texts(model, tokenizer, texts, max_tokens=512)
+        diff = _max_diff(reference, small_batches)
+        rows.append(('bucketing', 'max abs diff', diff, diff <= tolerance))
+
+        accuracy = compare_encoders(model, quantize_model(model), tokenizer, texts[:64])
+        rows.append(('int8', 'mean cosine', accuracy['mean_cosine'], accuracy['mean_cosine'] >= min_cosine))
+
+        chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+        started = time.perf_counter()
+        with encoder_pool(path, workers) as pool:
+            sharded = np.concatenate([encode_sharded(path, chunk, workers=workers, pool=pool)[0]
+                                      for chunk in chunks])
+        shared_s = time.perf_counter() - started
+        diff = _max_diff(reference, sharded)
+        rows.append(('sharded', 'max abs diff', diff, diff <= tolerance))
+        rows.append(('sharded', f'shared pool, {len(chunks)} chunks (s)', shared_s, True))
+
+        started = time.perf_counter()
+        for chunk in chunks:
+            encode_sharded(path, chunk, workers=workers)
+        rows.append(('sharded', f'pool per chunk, {len(chunks)} chunks (s)', time.perf_counter() - started, True))
+    return pd.DataFrame(rows, columns=['check', 'measure', 'value', 'ok'])
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Check the CPU encoding paths on a small random BERT")
+    parser.add_argument('--texts', type=int, default=400)
+    parser.add_argument('--workers', type=int, default=2)
+    args = parser.parse_args()
+    report = run_checks(args.texts, args.workers)
+    print(report.to_string(index=False))
+    sys.exit(0 if report['ok'].all() else 1)
@@ -0,0 +1,92 @@
+# figure_cache.py
+import io
+import threading
+from collections import OrderedDict
+
+from .stage_cache import fingerprint
+
+# ---------------------------
+# Rendered-figure cache
+# ---------------------------
+# Every chart is drawn from a small aggregate (value counts, a slice of the
+# temporal cube, a top-k frame) plus a few style parameters, so the rendered
+# result is kept under fingerprint(draw function, data, style):
+#
+#   matplotlib / seaborn   draw(fig, *data, **style) draws on a new Figure
+#                          created here (and sizes it); it is saved once to
+#                          PNG (or SVG) bytes and closed even if draw raises,
+#                          so no figure stays in pyplot's registry
+#   plotly                 draw(*data, **style) returns a go.Figure, kept as
+#                          built; its JSON is serialized once to size it
+#
+# Everything a draw function uses has to come in through data or style: its
+# code is part of the key, the values of variables it closes over are not.
+# Entries are evicted least recently used first once max_entries or
+# max_bytes is exceeded.
+class FigureCache:
+    def __init__(self, max_entries=512, max_bytes=256 * 1024**2):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._entries = OrderedDict()  # key -> (rendered figure, size in bytes)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def _put(self, key, value, size):
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self.nbytes += size
+            while len(self._entries) > 1 and (len(self._entries) > self.max_entries or
+                                              self.nbytes > self.max_bytes):
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+
+    def matplotlib(self, draw, *data, fmt='png', dpi=200, **style):
+        # PNG bytes, or SVG text for fmt='svg'; same savefig options as st.pyplot
+        key = fingerprint('matplotlib', draw, data, style, fmt, dpi)
+        image = self._get(key)
+        if image is None:
+            import matplotlib.pyplot as plt
+            fig = plt.figure()
+            try:
+                draw(fig, *data, **style)
+                buffer = io.BytesIO()
+                fig.savefig(buffer, format=fmt, dpi=dpi, bbox_inches='tight')
+            finally:
+                plt.close(fig)
+            image = buffer.getvalue()
+            if fmt == 'svg':
+                image = image.decode('utf-8')
+            self._put(key, image, len(image))
+        return image
+
+    def plotly(self, draw, *data, **style):
+        # st.plotly_chart re-validates whatever it is given; a built figure
+        # is cheaper to re-validate than a dict parsed from cached JSON
+        key = fingerprint('plotly', draw, data, style)
+        figure = self._get(key)
+        if figure is None:
+            figure = draw(*data, **style)
+            self._put(key, figure, len(figure.to_json()))
+        return figure
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
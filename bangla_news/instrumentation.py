@@ -0,0 +1,179 @@
+# instrumentation.py
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from .memory_report import peak_rss_mb
+
+# ---------------------------
+# Per-stage instrumentation
+# ---------------------------
+# One Instrumentation per page run. Each stage records:
+#
+#   wall_s          elapsed time
+#   cpu_s           CPU time of this process (all threads) plus finished
+#                   child processes, so process-pool stages are counted too
+#   peak_rss_mb     peak process RSS after the stage
+#   peak_delta_mb   how much the stage raised the peak (0 if it stayed below
+#                   an earlier peak); with trace_memory=True the tracemalloc
+#                   peak of the stage's own allocations instead
+#   rows, rows_per_s
+#
+# With profile=True a sampling thread snapshots the calling thread's stack
+# every interval seconds while the stage runs and the hottest functions are
+# kept with the record. Work done inside worker processes is not sampled.
+def _cpu_seconds():
+    t = os.times()
+    return t.user + t.system + t.children_user + t.children_system
+
+
+def rows_of(value):
+    if isinstance(value, tuple) and value:
+        value = value[0]
+    for attr in ('n_docs', 'total'):
+        if hasattr(value, attr) and not callable(getattr(value, attr)):
+            return int(getattr(value, attr))
+    try:
+        return len(value)
+    except TypeError:
+        return None
+
+
+class StackSampler:
+    def __init__(self, thread_id, interval=0.005):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.self_counts = Counter()
+        self.total_counts = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            self.samples += 1
+            seen = set()
+            leaf = True
+            while frame is not None:
+                code = frame.f_code
+                name = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+                if leaf:
+                    self.self_counts[name] += 1
+                    leaf = False
+                if name not in seen:  # count recursive frames once
+                    self.total_counts[name] += 1
+                    seen.add(name)
+                frame = frame.f_back
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def top(self, n=15):
+        rows = [{
+            'function': name,
+            'self_samples': self.self_counts[name],
+            'total_samples': count,
+            'total_share': count / max(self.samples, 1),
+        } for name, count in self.total_counts.most_common()]
+        frame = pd.DataFrame(rows, columns=['function', 'self_samples', 'total_samples', 'total_share'])
+        return frame.sort_values(['self_samples', 'total_samples'], ascending=False).head(n).reset_index(drop=True)
+
+
+class Instrumentation:
+    def __init__(self, profile=False, trace_memory=False, interval=0.005):
+        self.run_id = f"{datetime.now(timezone.utc):%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:6]}"
+        self.profile = profile
+        self.trace_memory = trace_memory
+        self.interval = interval
+        self.records = []
+        self.profiles = {}  # stage -> top functions
+
+    @contextmanager
+    def stage(self, name, rows=None, profile=None):
+        # Yields the record dict; the caller may fill in 'rows' or 'cache'
+        record = {'run_id': self.run_id, 'stage': name, 'rows': rows, 'cache': None,
+                  'started_at': datetime.now(timezone.utc).isoformat(timespec='milliseconds')}
+        sampler = None
+        if self.profile if profile is None else profile:
+            sampler = StackSampler(threading.get_ident(), self.interval).start()
+        tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.start()
+        peak_before = peak_rss_mb()
+        cpu_start, wall_start = _cpu_seconds(), time.perf_counter()
+        try:
+            yield record
+        finally:
+            record['wall_s'] = time.perf_counter() - wall_start
+            record['cpu_s'] = _cpu_seconds() - cpu_start
+            record['peak_rss_mb'] = peak_rss_mb()
+            if tracing:
+                record['peak_delta_mb'] = tracemalloc.get_traced_memory()[1] / 1024**2
+                tracemalloc.stop()
+            else:
+                record['peak_delta_mb'] = record['peak_rss_mb'] - peak_before
+            rows = record['rows']
+            record['rows_per_s'] = rows / record['wall_s'] if rows and record['wall_s'] > 0 else None
+            if sampler is not None:
+                sampler.stop()
+                self.profiles[name] = sampler.top()
+            self.records.append(record)
+
+    def call(self, name, fn, *args, rows=None, **kwargs):
+        with self.stage(name, rows) as record:
+            value = fn(*args, **kwargs)
+            if record['rows'] is None:
+                record['rows'] = rows_of(value)
+        return value
+
+    # ---------------------------
+    # Export
+    # ---------------------------
+    COLUMNS = ['run_id', 'stage', 'cache', 'wall_s', 'cpu_s', 'peak_delta_mb', 'peak_rss_mb',
+               'rows', 'rows_per_s', 'started_at']
+
+    def to_frame(self):
+        return pd.DataFrame(self.records, columns=self.COLUMNS)
+
+    def to_json(self):
+        return json.dumps({
+            'run_id': self.run_id,
+            'stages': self.to_frame().astype(object).where(lambda f: f.notna(), None).to_dict('records'),
+            'profiles': {stage: top.to_dict('records') for stage, top in self.profiles.items()},
+        }, indent=2)
+
+    def to_csv(self):
+        return self.to_frame().to_csv(index=False)
+
+    def save(self, directory=".instrumentation"):
+        os.makedirs(directory, exist_ok=True)
+        for ext, text in (('json', self.to_json()), ('csv', self.to_csv())):
+            with open(os.path.join(directory, f"{self.run_id}.{ext}"), 'w') as f:
+                f.write(text)
+
+
+def load_runs(directory=".instrumentation"):
+    # All saved runs as one frame, oldest first, for regression tracking
+    if not os.path.isdir(directory):
+        return pd.DataFrame(columns=Instrumentation.COLUMNS)
+    frames = [pd.read_csv(os.path.join(directory, name))
+              for name in sorted(os.listdir(directory)) if name.endswith('.csv')]
+    frames = [f for f in frames if len(f)]
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=Instrumentation.COLUMNS)
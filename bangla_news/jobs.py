@@ -0,0 +1,167 @@
+# jobs.py
+import itertools
+import threading
+import time
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+# ---------------------------
+# Background jobs
+# ---------------------------
+# Long stages (encoding the corpus, cleaning / tokenizing / counting it) run
+# on a shared worker pool instead of inside a button handler, so a widget
+# interaction, which reruns the script, no longer abandons them. The runner
+# is a cache_resource: jobs outlive the script run and the session that
+# started them, and a page finds its job again by key.
+#
+#   key          jobs with the same key do the same work. Submitting one
+#                while a job with that key is queued, running or done returns
+#                that job, so users on one server share a single encode
+#   max_workers  how many jobs run at once; the others wait in the queue
+#   progress     fn(job, *args, **kwargs) calls job.progress(done, total)
+#                as it goes and the UI polls job.fraction. After cancel(),
+#                the next progress call raises JobCancelled inside the job
+#
+# Finished jobs keep their result until max_finished newer jobs have
+# finished; failed and cancelled jobs are never reused for a key.
+class JobCancelled(Exception):
+    pass
+
+
+class Job:
+    def __init__(self, job_id, name, key):
+        self.id = job_id
+        self.name = name
+        self.key = key
+        self.status = 'queued'  # queued, running, done, failed or cancelled
+        self.done = 0
+        self.total = None
+        self.message = ''
+        self.result = None
+        self.error = None
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self._cancel = threading.Event()
+        self._future = None
+
+    @property
+    def active(self):
+        return self.status in ('queued', 'running')
+
+    @property
+    def cancelling(self):
+        return self.active and self._cancel.is_set()
+
+    @property
+    def fraction(self):
+        return min(self.done / self.total, 1.0) if self.total else 0.0
+
+    @property
+    def wall_s(self):
+        if self.started_at is None:
+            return None
+        return (self.finished_at or time.time()) - self.started_at
+
+    def progress(self, done, total=None, message=None):
+        # Called by the job function; also where a cancel request takes effect
+        if self._cancel.is_set():
+            raise JobCancelled(self.id)
+        self.done = done
+        if total is not None:
+            self.total = total
+        if message is not None:
+            self.message = message
+
+    def cancel(self):
+        self._cancel.set()
+        if self._future is not None and self._future.cancel():
+            self._finish('cancelled')  # never started
+
+    def _finish(self, status):
+        self.status = status
+        self.finished_at = time.time()
+
+
+class JobRunner:
+    def __init__(self, max_workers=1, max_finished=32):
+        self.max_workers = max_workers
+        self.max_finished = max_finished
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='job')
+        self._jobs = OrderedDict()  # id -> Job, in submission order
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def submit(self, name, fn, *args, key=None, **kwargs):
+        with self._lock:
+            job = self._find(key) if key is not None else None
+            if job is not None and job.status in ('queued', 'running', 'done'):
+                return job
+            job = Job(f"{name}-{next(self._ids)}", name, key)
+            self._jobs[job.id] = job
+            job._future = self._pool.submit(self._run, job, fn, args, kwargs)
+        return job
+
+    def _run(self, job, fn, args, kwargs):
+        if job._cancel.is_set():
+            job._finish('cancelled')
+            return
+        job.status = 'running'
+        job.started_at = time.time()
+        try:
+            job.result = fn(job, *args, **kwargs)
+        except JobCancelled:
+            job._finish('cancelled')
+        except Exception:
+            job.error = traceback.format_exc()
+            job._finish('failed')
+        else:
+            if job.total:
+                job.done = job.total
+            job._finish('done')
+        finally:
+            with self._lock:
+                self._forget()
+
+    def _find(self, key):
+        for job in reversed(self._jobs.values()):
+            if job.key == key:
+                return job
+        return None
+
+    def _forget(self):
+        finished = [job_id for job_id, job in self._jobs.items() if not job.active]
+        for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job_id]
+
+    def find(self, key):
+        # Latest job submitted with this key, whatever its status
+        with self._lock:
+            return self._find(key)
+
+    def get(self, job_id):
+        return self._jobs.get(job_id)
+
+    def jobs(self):
+        with self._lock:
+            return list(self._jobs.values())
+
+    def queued_before(self, job):
+        # Queued jobs that will start before this one
+        jobs = self.jobs()
+        return sum(other.status == 'queued' for other in jobs[:jobs.index(job)]) if job in jobs else 0
+
+    def cancel(self, job_id):
+        job = self.get(job_id)
+        if job is not None:
+            job.cancel()
+
+    def to_frame(self):
+        rows = [{'job': job.id, 'status': 'cancelling' if job.cancelling else job.status,
+                 'progress': job.fraction, 'message': job.message, 'wall_s': job.wall_s,
+                 'error': job.error.strip().splitlines()[-1] if job.error else None}
+                for job in self.jobs()]
+        return pd.DataFrame(rows, columns=['job', 'status', 'progress', 'message', 'wall_s', 'error'])
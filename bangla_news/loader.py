@@ -0,0 +1,206 @@
+# loader.py
+import csv
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+try:
+    import ijson
+except ImportError:  # fall back to json.load when ijson is not installed
+    ijson = None
+
+# ---------------------------
+# Dataset 1 (newspaper.json)
+# ---------------------------
+# Only the fields the pipeline actually reads. author, category_bn, tag,
+# comment_count and modification_date are dropped downstream anyway.
+DATASET1_COLUMNS = ['title', 'content', 'category', 'published_date', 'url']
+DICTIONARY_COLUMNS = ['category']
+
+
+def sidecar_path(path):
+    return os.path.splitext(path)[0] + '.parquet'
+
+
+def _source_signature(path):
+    stat = os.stat(path)
+    return {'source_size': str(stat.st_size), 'source_mtime': str(int(stat.st_mtime))}
+
+
+def _sidecar_is_fresh(path, sidecar, columns):
+    if not os.path.exists(sidecar):
+        return False
+    try:
+        metadata = pq.read_schema(sidecar).metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        return False
+    metadata = {k.decode(): v.decode() for k, v in metadata.items()}
+    if any(metadata.get(k) != v for k, v in _source_signature(path).items()):
+        return False
+    stored = set(json.loads(metadata.get('columns', '[]')))
+    return set(columns) <= stored
+
+
+def _iter_json_records(path):
+    # Stream a top-level JSON array record by record; anything else is
+    # handed to pandas as a whole.
+    with open(path, 'rb') as f:
+        head = f.read(64).lstrip()
+        f.seek(0)
+        if not head.startswith(b'['):
+            for record in pd.read_json(path).to_dict(orient='records'):
+                yield record
+        elif ijson is not None:
+            yield from ijson.items(f, 'item', use_float=True)
+        else:
+            yield from json.load(f)
+
+
+def _to_string(value):
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, float) and value != value:  # NaN
+        return None
+    return str(value)
+
+
+def _records_to_table(buffer, columns, schema):
+    arrays = []
+    for col in columns:
+        arr = pa.array([_to_string(v) for v in buffer[col]], type=pa.string())
+        if col in DICTIONARY_COLUMNS:
+            arr = arr.dictionary_encode()
+        arrays.append(arr)
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def _write_sidecar(path, sidecar, columns, chunk_rows):
+    fields = [
+        pa.field(col, pa.dictionary(pa.int32(), pa.string()) if col in DICTIONARY_COLUMNS else pa.string())
+        for col in columns
+    ]
+    metadata = dict(_source_signature(path), columns=json.dumps(list(columns)))
+    schema = pa.schema(fields, metadata=metadata)
+
+    tmp_path = sidecar + '.tmp'
+    buffer = {col: [] for col in columns}
+    n_buffered = 0
+    with pq.ParquetWriter(tmp_path, schema) as writer:
+        for record in _iter_json_records(path):
+            for col in columns:
+                buffer[col].append(record.get(col))
+            n_buffered += 1
+            if n_buffered >= chunk_rows:
+                writer.write_table(_records_to_table(buffer, columns, schema))
+                buffer = {col: [] for col in columns}
+                n_buffered = 0
+        if n_buffered:
+            writer.write_table(_records_to_table(buffer, columns, schema))
+    os.replace(tmp_path, sidecar)
+
+
+def load_newspaper_json(path, columns=DATASET1_COLUMNS, chunk_rows=50_000):
+    # First call streams the raw JSON into a column-projected Parquet sidecar
+    # one chunk at a time; every later call memory-maps the sidecar instead.
+    columns = list(columns)
+    sidecar = sidecar_path(path)
+    if not _sidecar_is_fresh(path, sidecar, columns):
+        _write_sidecar(path, sidecar, columns, chunk_rows)
+
+    read_dictionary = [col for col in columns if col in DICTIONARY_COLUMNS]
+    table = pq.read_table(sidecar, columns=columns, memory_map=True,
+                          read_dictionary=read_dictionary or None)
+    return table.to_pandas()
+
+
+# ---------------------------
+# Dataset 2 (Bangla_Newspaper_Article_Dataset.csv)
+# ---------------------------
+DATASET2_COLUMNS = ['title', 'content', 'category', 'published_date']
+ARROW_STRING = pd.StringDtype('pyarrow')
+
+
+def _csv_header(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return next(csv.reader(f), [])
+
+
+def _arrow_csv_options(columns, block_size):
+    read_options = pa_csv.ReadOptions(use_threads=True, block_size=block_size)
+    # Article bodies contain quoted newlines
+    parse_options = pa_csv.ParseOptions(newlines_in_values=True)
+    convert_options = pa_csv.ConvertOptions(
+        include_columns=columns,
+        column_types={col: pa.string() for col in columns},
+        strings_can_be_null=True,  # '' / 'NA' / 'null' become nulls, like pd.read_csv
+    )
+    return read_options, parse_options, convert_options
+
+
+def _arrow_to_frame(table):
+    return table.to_pandas(types_mapper={pa.string(): ARROW_STRING}.get)
+
+
+def _finish_frame(df):
+    if 'category' in df.columns:
+        df['category'] = df['category'].astype('category')
+    return df
+
+
+def _iter_csv_chunks(path, columns, engine, block_size, chunk_rows):
+    if engine == 'arrow':
+        options = _arrow_csv_options(columns, block_size)
+        with pa_csv.open_csv(path, *options) as reader:
+            for batch in reader:
+                yield _arrow_to_frame(pa.Table.from_batches([batch]))
+    else:
+        dtypes = {col: ARROW_STRING for col in columns}
+        yield from pd.read_csv(path, encoding='utf-8', usecols=columns,
+                               dtype=dtypes, chunksize=chunk_rows)
+
+
+def _clean_chunks(chunks, subset='content'):
+    # dropna + drop_duplicates(keep='first') applied per chunk; content hashes
+    # seen in earlier chunks are carried over so the result matches doing it
+    # on the fully materialized frame. A set keeps each chunk's lookups linear
+    # in its own size however many chunks came before.
+    seen = set()
+    for chunk in chunks:
+        chunk = chunk.dropna()
+        chunk = chunk.drop_duplicates(subset=[subset], keep='first')
+        hashes = pd.util.hash_array(chunk[subset].to_numpy(dtype=object)).tolist()
+        fresh = np.fromiter((h not in seen for h in hashes), dtype=bool, count=len(hashes))
+        seen.update(hashes)
+        yield chunk[fresh]
+
+
+def load_article_csv(path, columns=DATASET2_COLUMNS, engine='arrow', chunked=False,
+                     block_size=16 << 20, chunk_rows=100_000):
+    # engine='arrow' uses the multi-threaded pyarrow CSV reader; 'pandas' is the
+    # single-threaded C engine. Text columns come back as string[pyarrow] and
+    # category as a categorical. chunked=True also runs dropna/drop_duplicates
+    # on each chunk while reading, so the raw frame is never materialized.
+    header = _csv_header(path)
+    columns = [col for col in columns if col in header]
+
+    if chunked:
+        chunks = _iter_csv_chunks(path, columns, engine, block_size, chunk_rows)
+        parts = list(_clean_chunks(chunks))
+        if parts:
+            df = pd.concat(parts, ignore_index=True)
+        else:
+            df = pd.DataFrame({col: pd.Series(dtype=ARROW_STRING) for col in columns})
+        return _finish_frame(df)
+
+    if engine == 'arrow':
+        table = pa_csv.read_csv(path, *_arrow_csv_options(columns, block_size))
+        df = _arrow_to_frame(table)
+    else:
+        df = pd.read_csv(path, encoding='utf-8', usecols=columns,
+                         dtype={col: ARROW_STRING for col in columns})
+    return _finish_frame(df)
@@ -0,0 +1,82 @@
+# memory_report.py
+import resource
+import sys
+
+import pandas as pd
+
+from .loader import ARROW_STRING
+
+# ---------------------------
+# dtype optimization
+# ---------------------------
+# Low-cardinality text (category, dataset) becomes a categorical, other text
+# becomes Arrow-backed strings (one contiguous buffer instead of a Python
+# object per cell) and numbers are downcast to the smallest dtype that holds
+# them. Columns listed in keep are left alone.
+def optimize_frame(df, max_category_ratio=0.5, keep=()):
+    df = df.copy(deep=False)
+    for column in df.columns:
+        if column in keep:
+            continue
+        series = df[column]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            df[column] = series.cat.remove_unused_categories()
+        elif pd.api.types.is_string_dtype(series.dtype) or series.dtype == object:
+            if series.dtype == object and pd.api.types.infer_dtype(series, skipna=True) not in ('string', 'empty'):
+                continue  # mixed objects (lists, numbers): leave as they are
+            if len(series) and series.nunique(dropna=True) <= max_category_ratio * len(series):
+                df[column] = series.astype('category')
+            elif series.dtype != ARROW_STRING:
+                df[column] = series.astype(ARROW_STRING)
+        elif pd.api.types.is_integer_dtype(series.dtype) and not pd.api.types.is_extension_array_dtype(series.dtype):
+            df[column] = pd.to_numeric(series, downcast='integer')
+        elif pd.api.types.is_float_dtype(series.dtype) and not pd.api.types.is_extension_array_dtype(series.dtype):
+            df[column] = pd.to_numeric(series, downcast='float')
+    return df
+
+
+# ---------------------------
+# Per-stage memory report
+# ---------------------------
+# Replaces st.text(df.info()), which printed to stdout and returned None.
+# Each recorded frame keeps a per-column table of deep memory usage.
+def column_memory(df):
+    usage = df.memory_usage(deep=True, index=False)
+    table = pd.DataFrame({
+        'column': df.columns.astype(str),
+        'dtype': [str(t) for t in df.dtypes],
+        'non_null': df.notna().sum().to_numpy(),
+        'bytes': usage.to_numpy(),
+    })
+    table['MB'] = table['bytes'] / 1024**2
+    return table
+
+
+def peak_rss_mb():
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024**2 if sys.platform == 'darwin' else peak / 1024
+
+
+class MemoryReport:
+    def __init__(self):
+        self.frames = {}  # (stage, name) -> column table
+
+    def record(self, stage, name, df):
+        table = column_memory(df)
+        table.attrs['rows'] = len(df)
+        self.frames[(stage, name)] = table
+        return table
+
+    def summary(self):
+        rows = [{
+            'stage': stage,
+            'frame': name,
+            'rows': table.attrs.get('rows', 0),
+            'columns': len(table),
+            'MB': table['bytes'].sum() / 1024**2,
+        } for (stage, name), table in self.frames.items()]
+        return pd.DataFrame(rows, columns=['stage', 'frame', 'rows', 'columns', 'MB'])
+
+    def columns(self, stage, name):
+        return self.frames[(stage, name)]
@@ -0,0 +1,123 @@
+# ngram_counts.py
+import numpy as np
+import pandas as pd
+
+from .term_matrix import build_category_term_matrix
+
+# ---------------------------
+# Per-category n-gram frequency tables
+# ---------------------------
+# Built once from a TokenStore and shared by the unique-words, top-words,
+# bigram and wordcloud pages.
+#
+#   unigram[c, w]          count of word id w in category c (sparse CSR, C x V)
+#   ngrams[n] = (grams, counts, bounds)
+#       grams[lo:hi]       (m, n) word ids of the n-grams of category c,
+#       counts[lo:hi]      highest count first, lo, hi = bounds[c], bounds[c + 1]
+#
+# Bigrams and trigrams are counted without building any strings: each
+# n-gram is packed into one int64 (w1 * V + w2) * V + w3 ... and counted
+# with np.unique, and only the rows a page asks for are decoded.
+MAX_PACKED = 2 ** 63
+
+
+def _pack(ids, starts, n, vocab_size):
+    keys = ids[starts]
+    for j in range(1, n):
+        keys = keys * vocab_size + ids[starts + j]
+    return keys
+
+
+def _unpack(keys, n, vocab_size):
+    grams = np.empty((len(keys), n), dtype=np.int32)
+    keys = keys.copy()
+    for j in reversed(range(n)):
+        grams[:, j] = keys % vocab_size
+        keys //= vocab_size
+    return grams
+
+
+def count_ngrams(ids, offsets, n, vocab_size):
+    # ids / offsets of one contiguous block of documents (one category).
+    # Returns the distinct n-grams as an (m, n) id array and their counts,
+    # highest count first.
+    ids = ids.astype(np.int64)
+    n_starts = max(len(ids) - n + 1, 0)
+    doc_end = np.repeat(offsets[1:], np.diff(offsets))[:n_starts]
+    # An n-gram starting at i is valid if it ends inside the same document
+    starts = np.flatnonzero(doc_end >= np.arange(n, n + n_starts))
+
+    if vocab_size ** n < MAX_PACKED:
+        keys, counts = np.unique(_pack(ids, starts, n, vocab_size), return_counts=True)
+        grams = _unpack(keys, n, vocab_size)
+    else:  # vocabulary too large to pack this order into 64 bits
+        columns = np.stack([ids[starts + j] for j in range(n)], axis=1)
+        grams, counts = np.unique(columns, axis=0, return_counts=True)
+        grams = grams.astype(np.int32)
+
+    order = np.argsort(-counts, kind='stable')
+    return grams[order], counts[order].astype(np.int64)
+
+
+class NgramCounts:
+    def __init__(self, vocab, categories, unigram, ngrams):
+        self.vocab = vocab
+        self.categories = list(categories)
+        self.unigram = unigram
+        self.ngrams = ngrams
+
+    @classmethod
+    def from_store(cls, store, orders=(2, 3)):
+        n_categories, vocab_size = len(store.categories), store.vocab_size
+
+        # Unigrams: one pass over (category, word) keys for the whole corpus
+        unigram = build_category_term_matrix(store)
+
+        ngrams = {}
+        for n in orders:
+            grams, counts, sizes = [], [], []
+            for category in store.categories:
+                g, f = count_ngrams(store.category_ids(category), store.category_offsets(category), n, vocab_size)
+                grams.append(g)
+                counts.append(f)
+                sizes.append(len(f))
+            bounds = np.zeros(n_categories + 1, dtype=np.int64)
+            np.cumsum(sizes, out=bounds[1:])
+            ngrams[n] = (np.concatenate(grams) if grams else np.empty((0, n), dtype=np.int32),
+                         np.concatenate(counts) if counts else np.empty(0, dtype=np.int64),
+                         bounds)
+
+        return cls(store.vocab, store.categories, unigram, ngrams)
+
+    # ---------------------------
+    # Queries
+    # ---------------------------
+    def category_code(self, category):
+        return self.categories.index(category)
+
+    def top_k(self, category, k=100, n=1):
+        # [(word or 'w1 w2 ...', frequency), ...], highest frequency first
+        c = self.category_code(category)
+        if n == 1:
+            lo, hi = self.unigram.indptr[c], self.unigram.indptr[c + 1]
+            word_ids, freq = self.unigram.indices[lo:hi], self.unigram.data[lo:hi]
+            top = np.argsort(-freq, kind='stable')[:k]
+            return list(zip(self.vocab[word_ids[top]].tolist(), freq[top].tolist()))
+        if n not in self.ngrams:
+            raise ValueError(f"n-gram order {n} was not counted; available: 1, {sorted(self.ngrams)}")
+        grams, counts, bounds = self.ngrams[n]
+        lo = bounds[c]
+        hi = min(bounds[c + 1], lo + k)
+        words = self.vocab[grams[lo:hi]]
+        return [(' '.join(row), int(freq)) for row, freq in zip(words, counts[lo:hi])]
+
+    def frequencies(self, category, k=100, n=1):
+        return dict(self.top_k(category, k, n))
+
+    def top_k_frame(self, k=100, n=1, column='word'):
+        rows = [
+            {'category': category, column: gram, 'frequency': freq}
+            for category in self.categories
+            for gram, freq in self.top_k(category, k, n)
+        ]
+        return pd.DataFrame(rows, columns=['category', column, 'frequency'])
@@ -0,0 +1,197 @@
+# pipeline.py
+import os
+
+import pandas as pd
+
+from .balancing import balance_frame
+from .date_parsing import parse_bangla_dates
+from .dedup import exact_duplicates, find_duplicates
+from .loader import ARROW_STRING, load_article_csv, load_newspaper_json
+from .memory_report import optimize_frame
+from .ngram_counts import NgramCounts
+from .stage_cache import file_fingerprint
+from .temporal_cube import TemporalCube
+from .text_cleaning import clean_texts, remove_class_words_grouped, stopword_matcher
+from .token_store import TokenStore
+
+# ---------------------------
+# Raw datasets
+# ---------------------------
+DATASETS = {
+    'dataset1': ("1KYEuvvLLV7a0IRTaOU-U5X9Ysf6wN7W8", "newspaper.json"),
+    'dataset2': ("1OtPy0n-LsceeDPJI5yfK8ekVneHHkeLR", "Bangla_Newspaper_Article_Dataset.csv"),
+}
+
+
+def download(name):
+    # gdown is only imported when a file actually has to be fetched
+    file_id, output = DATASETS[name]
+    if not os.path.exists(output):
+        import gdown
+        gdown.download(f"https://drive.google.com/uc?id={file_id}", output, quiet=False)
+    return output
+
+
+# ---------------------------
+# Stage functions
+# ---------------------------
+def load_dataset1(path):
+    # Streams only the needed columns on first load and writes a Parquet
+    # sidecar next to the JSON; later loads memory-map the sidecar.
+    df1 = load_newspaper_json(path)
+    df1 = df1[~exact_duplicates(df1['content'])]
+    df1 = df1[~df1['category'].isin(['bangladesh', 'opinion'])]
+    df1['category'] = df1['category'].cat.remove_unused_categories()
+    return df1.reset_index(drop=True)
+
+
+def combine_datasets(df1, df2):
+    df1_clean = df1.drop(columns=['author', 'category_bn', 'modification_date', 'tag', 'comment_count'], errors='ignore')
+    df1_clean.rename(columns={'url': 'source'}, inplace=True)
+    df1_clean = df1_clean.dropna().reset_index(drop=True)
+    df1_clean['category'] = df1_clean['category'].astype(str).replace('life-style', 'lifestyle')
+    df1_clean = df1_clean[~df1_clean['category'].isin(['bangladesh', 'opinion'])]
+
+    df2_clean = df2.dropna().reset_index(drop=True)
+
+    combined = pd.concat([df1_clean.assign(dataset='dataset1'), df2_clean.assign(dataset='dataset2')],
+                         ignore_index=True)
+    # Categoricals for category / dataset, Arrow strings for the text columns
+    return optimize_frame(combined)
+
+
+def deduplicate(df, threshold):
+    keep, removed, report = find_duplicates(df['content'], threshold=threshold, groups=df['dataset'])
+    return df[keep].reset_index(drop=True), report
+
+
+def balance_classes(df, target_size, strategy='last'):
+    datetimes = None
+    if strategy == 'time':
+        datetimes = parse_bangla_dates(df['published_date'])[0].to_numpy()
+    return balance_frame(df, target_size, strategy, seed=42, datetimes=datetimes)
+
+
+def apply_clean_text(df, stopwords):
+    # Chunked, multi-process equivalent of df['content'].apply(clean_text);
+    # assign adds the column without copying the existing ones
+    return df.assign(cleaned_content=clean_texts(df['content'], stopwords).astype(ARROW_STRING))
+
+
+# Words to remove per class
+CLASS_WORD_MAP = {
+    'technology': ['প্রতিমন্ত্রী', 'ব্যাংক', 'বাজারে','তথ্য', 'বাংলাদেশের', 'টাকা', 'নামের', 'সংখ্যা', 'পণ্য'],
+    'economy': ['ছাত্রলীগের','প্রতিষ্ঠান', 'তথ্য', 'সরকার'],
+    'entertainment': ['প্রতিমন্ত্রী', 'ব্যাংক', 'বাজারে','সামাজিক','পোস্ট'],
+    'health': ['ঘন্টায়','গেছেন','দাঁড়িয়েছে','জানানো','বিজ্ঞপ্তি', 'সংখ্যা','বাইরে'],
+    'education': ['সভাপতি','ইসলাম','শেখ', 'কমিটি', 'ছাত্রলীগের','অনুষ্ঠিত','তথ্য', 'এদিকে', 'সূত্র'],
+    'crime': ['রাজধানী','ইসলাম','আলোকে', 'এলাকার'],
+    'lifestyle': ['টাকা'],
+    'environment': ['তথ্য'],
+}
+
+
+def apply_class_words(df, class_word_map):
+    cleaned = remove_class_words_grouped(df['cleaned_content'], df['category'], class_word_map)
+    return df.assign(cleaned_content=cleaned.astype(ARROW_STRING))
+
+
+def parse_dates(df):
+    datetimes, report = parse_bangla_dates(df['published_date'])
+    return datetimes.to_frame(), report
+
+
+# ---------------------------
+# Shared stages
+# ---------------------------
+# Pages get their data from a Pipeline instead of globals left behind by
+# earlier pages. A stage's key only needs the keys upstream of it, so
+# get('class_words') loads that one frame from the stage cache; upstream
+# stages are only loaded (or computed) when a stage misses.
+#
+#   dataset1 + dataset2 -> combine -> dedup -> balance -> clean_text -> class_words -> tokenize -> ngram_counts
+#                                       \--> parse_dates (+ dedup) -> temporal_cube
+#
+# run has the signature of StageCache.run_lazy; the app passes a wrapper
+# that also records instrumentation. fork() gives a pipeline with the same
+# settings for a background job (jobs.py), which has no session to record to.
+STAGES = ['dataset1', 'dataset2', 'combine', 'dedup', 'balance', 'clean_text', 'class_words', 'tokenize',
+          'ngram_counts', 'parse_dates', 'temporal_cube']
+
+
+class Pipeline:
+    def __init__(self, cache, run=None, dedup_threshold=0.8, target_size=5000, balance_strategy='last',
+                 chunked=False):
+        self.cache = cache
+        self.run = run or cache.run_lazy
+        self.dedup_threshold = dedup_threshold
+        self.target_size = target_size
+        self.balance_strategy = balance_strategy
+        self.chunked = chunked  # dropna/drop_duplicates per chunk while reading dataset 2
+        self._keys = {}
+        self._values = {}
+
+    def _spec(self, stage):
+        # (fn, upstream stages, args from the upstream values, extra deps, params)
+        if stage in ('dataset1', 'dataset2'):
+            path = download(stage)
+            if stage == 'dataset1':
+                return load_dataset1, (), lambda: (path,), [file_fingerprint(path)], {}
+            # Multi-threaded Arrow reader, only the needed columns, string[pyarrow] text
+            return (load_article_csv, (), lambda: (path,), [file_fingerprint(path)],
+                    {'engine': 'arrow', 'chunked': self.chunked})
+        if stage == 'combine':
+            return combine_datasets, ('dataset1', 'dataset2'), lambda df1, df2: (df1, df2), [], {}
+        if stage == 'dedup':
+            return deduplicate, ('combine',), lambda df: (df,), [], {'threshold': self.dedup_threshold}
+        if stage == 'balance':
+            return (balance_classes, ('dedup',), lambda dedup: (dedup[0],), [],
+                    {'target_size': self.target_size, 'strategy': self.balance_strategy})
+        if stage == 'clean_text':
+            return apply_clean_text, ('balance',), lambda df: (df,), [], {'stopwords': stopword_matcher}
+        if stage == 'class_words':
+            return apply_class_words, ('clean_text',), lambda df: (df,), [], {'class_word_map': CLASS_WORD_MAP}
+        if stage == 'tokenize':
+            return (TokenStore.from_texts, ('class_words',), lambda df: (df['cleaned_content'], df['category']),
+                    [], {})
+        if stage == 'ngram_counts':
+            return NgramCounts.from_store, ('tokenize',), lambda store: (store,), [], {}
+        if stage == 'parse_dates':
+            return parse_dates, ('dedup',), lambda dedup: (dedup[0],), [], {}
+        if stage == 'temporal_cube':
+            return (TemporalCube.from_datetimes, ('parse_dates', 'dedup'),
+                    lambda dates, dedup: (dates[0]['datetime'], dedup[0]['category']), [], {})
+        raise KeyError(f"Unknown stage {stage!r}; expected one of {STAGES}")
+
+    def key(self, stage):
+        if stage not in self._keys:
+            fn, upstream, _, deps, params = self._spec(stage)
+            self._keys[stage] = self.cache.key(stage, fn, [self.key(u) for u in upstream] + deps, params)
+        return self._keys[stage]
+
+    def get(self, stage):
+        if stage not in self._values:
+            fn, upstream, make_args, deps, params = self._spec(stage)
+            resolve_args = lambda: make_args(*(self.get(u) for u in upstream))
+            self._values[stage], self._keys[stage] = self.run(
+                stage, fn, resolve_args, deps=[self.key(u) for u in upstream] + deps, **params)
+        return self._values[stage]
+
+    def fork(self, run=None):
+        return Pipeline(self.cache, run, self.dedup_threshold, self.target_size, self.balance_strategy,
+                        self.chunked)
+
+    def drop(self, *stages):
+        # Forget loaded values so only one copy of the corpus stays alive;
+        # they are still in the stage cache
+        for stage in stages:
+            self._values.pop(stage, None)
+
+
+def compute_stages(job, pipeline, stages):
+    # Job function: loads or computes each stage in turn so that the pages
+    # find them in the stage cache. Returns the stage keys.
+    for done, stage in enumerate(stages):
+        job.progress(done, len(stages), f"Computing {stage}")
+        pipeline.get(stage)
+    return {stage: pipeline.key(stage) for stage in stages}
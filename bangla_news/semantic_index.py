@@ -0,0 +1,213 @@
+# semantic_index.py
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+# ---------------------------
+# IVF (inverted file) index over article embeddings
+# ---------------------------
+# Vectors are L2-normalised, so the inner product is the cosine similarity.
+# Spherical k-means splits them into n_lists clusters; vectors are stored
+# grouped by cluster (like the TokenStore layout):
+#
+#   vectors[offsets[l]:offsets[l + 1]]   vectors of list l
+#   ids[...]                             caller's id of each vector (store row)
+#
+# A query only scores the vectors of its n_probe closest centroids. Batches of
+# queries are scored list by list with one matrix multiplication per list.
+def normalize(vectors):
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+def _top_k(scores, k):
+    # Column-wise top k of a (candidates, queries) score matrix, best first
+    k = min(k, scores.shape[0])
+    part = np.argpartition(-scores, k - 1, axis=0)[:k]
+    part_scores = np.take_along_axis(scores, part, axis=0)
+    order = np.argsort(-part_scores, axis=0, kind='stable')
+    return np.take_along_axis(part, order, axis=0), np.take_along_axis(part_scores, order, axis=0)
+
+
+def kmeans(vectors, n_lists, iters=20, seed=0, sample=50_000):
+    rng = np.random.default_rng(seed)
+    if len(vectors) > sample:
+        vectors = vectors[rng.choice(len(vectors), sample, replace=False)]
+    centroids = vectors[rng.choice(len(vectors), n_lists, replace=False)].copy()
+    for _ in range(iters):
+        assign = np.argmax(vectors @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, vectors)
+        counts = np.bincount(assign, minlength=n_lists)
+        empty = counts == 0
+        # Re-seed empty clusters from random points
+        sums[empty] = vectors[rng.choice(len(vectors), int(empty.sum()))]
+        centroids = normalize(sums)
+    return centroids
+
+
+class IVFIndex:
+    def __init__(self, centroids, vectors, ids, offsets, trained_size):
+        self.centroids = centroids
+        self.vectors = vectors
+        self.ids = ids
+        self.offsets = offsets
+        self.trained_size = trained_size
+
+    @classmethod
+    def build(cls, vectors, ids=None, n_lists=None, iters=20, seed=0):
+        vectors = normalize(vectors)
+        if ids is None:
+            ids = np.arange(len(vectors), dtype=np.int64)
+        n_lists = n_lists or max(1, int(np.sqrt(len(vectors))))
+        n_lists = min(n_lists, max(len(vectors), 1))
+        if len(vectors):
+            centroids = kmeans(vectors, n_lists, iters, seed)
+        else:
+            centroids = np.zeros((0, vectors.shape[1]), dtype=np.float32)
+        index = cls(centroids, vectors[:0], np.empty(0, dtype=np.int64),
+                    np.zeros(len(centroids) + 1, dtype=np.int64), len(vectors))
+        index.add(vectors, ids)
+        return index
+
+    @property
+    def dim(self):
+        return self.centroids.shape[1]
+
+    @property
+    def n_lists(self):
+        return len(self.centroids)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def needs_rebuild(self, growth=2.0):
+        # Centroids are fitted once; after the corpus has grown a lot the lists
+        # get unbalanced and the index should be rebuilt
+        return len(self) > growth * max(self.trained_size, 1)
+
+    # ---------------------------
+    # Incremental add
+    # ---------------------------
+    def add(self, vectors, ids):
+        # New vectors go to their nearest existing centroid; the grouped
+        # layout is rebuilt with one stable sort
+        vectors = normalize(vectors)
+        ids = np.asarray(ids, dtype=np.int64)
+        if not len(ids):
+            return
+        old_lists = np.repeat(np.arange(self.n_lists), np.diff(self.offsets))
+        new_lists = np.argmax(vectors @ self.centroids.T, axis=1)
+        lists = np.concatenate([old_lists, new_lists])
+        order = np.argsort(lists, kind='stable')
+        self.vectors = np.concatenate([np.asarray(self.vectors), vectors])[order]
+        self.ids = np.concatenate([np.asarray(self.ids), ids])[order]
+        self.offsets = np.searchsorted(lists[order], np.arange(self.n_lists + 1)).astype(np.int64)
+
+    # ---------------------------
+    # Search
+    # ---------------------------
+    def search(self, queries, k=10, n_probe=8):
+        # Returns (ids, scores), both (n_queries, k); -1 / -inf where fewer
+        # than k vectors were scanned
+        queries = normalize(np.atleast_2d(queries))
+        n_queries = len(queries)
+        best_ids = np.full((n_queries, k), -1, dtype=np.int64)
+        best_scores = np.full((n_queries, k), -np.inf, dtype=np.float32)
+        if not len(self) or not n_queries:
+            return best_ids, best_scores
+
+        n_probe = min(n_probe, self.n_lists)
+        probes = np.argpartition(-(queries @ self.centroids.T), n_probe - 1, axis=1)[:, :n_probe]
+
+        # Group (query, list) pairs by list and score each list once
+        pair_lists = probes.ravel()
+        pair_queries = np.repeat(np.arange(n_queries), n_probe)
+        order = np.argsort(pair_lists, kind='stable')
+        pair_lists, pair_queries = pair_lists[order], pair_queries[order]
+        starts = np.flatnonzero(np.r_[True, pair_lists[1:] != pair_lists[:-1]])
+        ends = np.r_[starts[1:], len(pair_lists)]
+
+        for start, end in zip(starts, ends):
+            lo, hi = self.offsets[pair_lists[start]], self.offsets[pair_lists[start] + 1]
+            if lo == hi:
+                continue
+            qs = pair_queries[start:end]
+            scores = np.asarray(self.vectors[lo:hi]) @ queries[qs].T  # (list size, queries)
+            top, top_scores = _top_k(scores, k)
+            # Merge with the best found so far for these queries
+            merged_ids = np.concatenate([best_ids[qs].T, np.asarray(self.ids[lo:hi])[top]])
+            merged_scores = np.concatenate([best_scores[qs].T, top_scores])
+            keep, kept_scores = _top_k(merged_scores, k)
+            best_ids[qs, :keep.shape[0]] = np.take_along_axis(merged_ids, keep, axis=0).T
+            best_scores[qs, :keep.shape[0]] = kept_scores.T
+        return best_ids, best_scores
+
+    def brute_force(self, queries, k=10, chunk=65_536):
+        queries = normalize(np.atleast_2d(queries))
+        best_ids = np.full((len(queries), k), -1, dtype=np.int64)
+        best_scores = np.full((len(queries), k), -np.inf, dtype=np.float32)
+        for lo in range(0, len(self), chunk):
+            scores = np.asarray(self.vectors[lo:lo + chunk]) @ queries.T
+            top, top_scores = _top_k(scores, k)
+            merged_ids = np.concatenate([best_ids.T, np.asarray(self.ids[lo:lo + chunk])[top]])
+            merged_scores = np.concatenate([best_scores.T, top_scores])
+            keep, kept_scores = _top_k(merged_scores, k)
+            best_ids[:, :keep.shape[0]] = np.take_along_axis(merged_ids, keep, axis=0).T
+            best_scores[:, :keep.shape[0]] = kept_scores.T
+        return best_ids, best_scores
+
+    # ---------------------------
+    # Recall vs. brute force
+    # ---------------------------
+    def benchmark(self, queries, k=10, n_probes=(1, 2, 4, 8, 16, 32)):
+        started = time.perf_counter()
+        exact, _ = self.brute_force(queries, k)
+        brute_ms = (time.perf_counter() - started) * 1000 / max(len(queries), 1)
+
+        rows = []
+        for n_probe in sorted({min(p, self.n_lists) for p in n_probes}):
+            started = time.perf_counter()
+            found, _ = self.search(queries, k, n_probe)
+            ms = (time.perf_counter() - started) * 1000 / max(len(queries), 1)
+            hits = [len(np.intersect1d(f[f >= 0], e[e >= 0])) for f, e in zip(found, exact)]
+            rows.append({
+                'n_probe': n_probe,
+                f'recall@{k}': sum(hits) / max(int((exact >= 0).sum()), 1),
+                'ms_per_query': ms,
+                'brute_force_ms_per_query': brute_ms,
+                'speedup': brute_ms / ms if ms else np.inf,
+                'scanned_fraction': min(n_probe / self.n_lists, 1.0),
+            })
+        return pd.DataFrame(rows)
+
+    # ---------------------------
+    # Persistence
+    # ---------------------------
+    # One .npy per array so the vectors load memory-mapped
+    def save(self, path):
+        os.makedirs(path, exist_ok=True)
+        for name in ('centroids', 'vectors', 'ids', 'offsets'):
+            tmp = os.path.join(path, f"{name}.tmp.npy")
+            np.save(tmp, np.asarray(getattr(self, name)))
+            os.replace(tmp, os.path.join(path, f"{name}.npy"))
+        with open(os.path.join(path, "meta.json"), "w") as f:
+            json.dump({'trained_size': int(self.trained_size), 'size': len(self)}, f)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        try:
+            with open(os.path.join(path, "meta.json")) as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            return None
+        arrays = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode='r' if mmap else None)
+                  for name in ('centroids', 'vectors', 'ids', 'offsets')}
+        if len(arrays['ids']) != meta['size']:  # interrupted save
+            return None
+        return cls(np.asarray(arrays['centroids']), arrays['vectors'], arrays['ids'],
+                   np.asarray(arrays['offsets']), meta['trained_size'])
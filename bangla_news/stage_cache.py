@@ -0,0 +1,328 @@
+# stage_cache.py
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import re
+import tempfile
+import threading
+import time
+import types
+from contextlib import suppress
+
+import numpy as np
+import pandas as pd
+
+# ---------------------------
+# Fingerprinting
+# ---------------------------
+def _update_digest(h, obj):
+    # Feeds a canonical byte form of obj into the hash. Sets are sorted so the
+    # same stopword list always gives the same key regardless of build order.
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        h.update(f"{type(obj).__name__}:{obj!r};".encode())
+    elif isinstance(obj, bytes):
+        h.update(b"bytes:" + obj + b";")
+    elif isinstance(obj, (list, tuple)):
+        h.update(f"{type(obj).__name__}[{len(obj)}]".encode())
+        for item in obj:
+            _update_digest(h, item)
+    elif isinstance(obj, (set, frozenset)):
+        h.update(f"set[{len(obj)}]".encode())
+        for item in sorted(obj, key=repr):
+            _update_digest(h, item)
+    elif isinstance(obj, dict):
+        h.update(f"dict[{len(obj)}]".encode())
+        for k in sorted(obj, key=repr):
+            _update_digest(h, k)
+            _update_digest(h, obj[k])
+    elif isinstance(obj, (pd.DataFrame, pd.Series)):
+        h.update(f"{type(obj).__name__}{obj.shape}".encode())
+        if isinstance(obj, pd.DataFrame):
+            _update_digest(h, [str(c) for c in obj.columns])
+            _update_digest(h, [str(d) for d in obj.dtypes])
+        try:
+            h.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+        except TypeError:  # unhashable cells, e.g. list columns
+            h.update(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+    elif isinstance(obj, np.ndarray):
+        h.update(f"ndarray{obj.shape}{obj.dtype}".encode())
+        h.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, types.CodeType):
+        h.update(obj.co_code)
+        _update_digest(h, list(obj.co_names))
+        for const in obj.co_consts:
+            _update_digest(h, const)
+    elif callable(obj) and hasattr(obj, '__code__'):
+        _update_digest(h, obj.__code__)
+    else:
+        h.update(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def fingerprint(*parts):
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        _update_digest(h, part)
+    return h.hexdigest()
+
+
+def _code_names(code):
+    # Global names used by a code object and the lambdas / comprehensions in it
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _code_names(const)
+    return names
+
+
+def _package_of(obj):
+    return (getattr(obj, '__module__', None) or '').split('.')[0]
+
+
+def _same_package(obj, package):
+    return _package_of(obj) == package
+
+
+def _is_constant(name, value):
+    if isinstance(value, (str, bytes, int, float, tuple, frozenset, np.generic, re.Pattern)):
+        return True
+    return name.isupper() and isinstance(value, (dict, set, list))  # BN_MONTHS, CLASS_WORD_MAP, ...
+
+
+@functools.lru_cache(maxsize=None)
+def code_fingerprint(obj):
+    # Source of a stage function (or class) and of every function and class of
+    # its own package it reaches through global names, transitively, plus the
+    # values of the module-level constants they use (not module state such
+    # as worker caches). Editing a helper such as clean_texts therefore
+    # changes the key of every stage that calls it.
+    todo = [getattr(obj, '__func__', obj)]
+    if isinstance(getattr(obj, '__self__', None), type):  # classmethods, e.g. TokenStore.from_texts
+        todo.append(obj.__self__)
+    package = _package_of(todo[0])
+    h = hashlib.blake2b(digest_size=16)
+    seen = set()
+    while todo:
+        current = todo.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        try:
+            source = inspect.getsource(current)
+        except (OSError, TypeError):
+            continue  # no source (builtins, interactive); its bytecode is still in the key
+        h.update(f"{current.__module__}.{current.__qualname__}\n{source}".encode())
+        if isinstance(current, type):
+            functions = [getattr(member, '__func__', member) for member in vars(current).values()]
+        else:
+            functions = [current]
+        for fn in functions:
+            if not hasattr(fn, '__code__'):
+                continue
+            for name in sorted(_code_names(fn.__code__)):
+                value = fn.__globals__.get(name)
+                if isinstance(value, types.ModuleType) or not _same_package(value, package) and callable(value):
+                    continue
+                if callable(value):
+                    todo.append(value)
+                elif _is_constant(name, value):
+                    _update_digest(h, (name, value))
+    return h.hexdigest()
+
+
+def file_fingerprint(path):
+    # Cheap identity for raw input files: path, size and mtime
+    stat = os.stat(path)
+    return f"file:{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+# ---------------------------
+# Content-addressed stage cache
+# ---------------------------
+class StageCache:
+    def __init__(self, root=".stage_cache", max_bytes=4 * 1024**3):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.stats = {}
+        self._lock = threading.Lock()
+        self._key_locks = {}  # key -> Lock while a miss on key is computed, so it is computed once
+        os.makedirs(root, exist_ok=True)
+
+    def key(self, stage, fn, deps=(), params=None):
+        # deps are upstream stage keys (or raw objects to hash); params are
+        # the knobs that change the output (target_size, stopwords, ...). The
+        # code of fn, of the helpers it calls and of the classes of package
+        # objects passed as params is part of the key as well.
+        params = params or {}
+        code = [code_fingerprint(fn)] + [code_fingerprint(type(value)) for value in params.values()
+                                         if _same_package(type(value), _package_of(fn))]
+        return f"{stage}-{fingerprint(stage, fn, code, list(deps), params)}"
+
+    def run(self, stage, fn, *args, deps=(), params=None, **kwargs):
+        # Positional args are data and are described by deps; keyword args are
+        # parameters and are always part of the fingerprint.
+        return self.run_lazy(stage, fn, lambda: args, deps=deps, params=params, **kwargs)
+
+    def run_lazy(self, stage, fn, resolve_args, deps=(), params=None, **kwargs):
+        # Like run, but the positional args come from resolve_args(), which is
+        # only called on a miss: a cached stage never loads its upstream data.
+        value, key, _ = self.lookup(stage, fn, resolve_args, deps=deps, params=params, **kwargs)
+        return value, key
+
+    def lookup(self, stage, fn, resolve_args, deps=(), params=None, **kwargs):
+        # run_lazy that also says whether this call was a hit. Sessions and
+        # background jobs run stages on their own threads; a thread that
+        # misses while another computes the same key waits for it and then
+        # loads the stored result, which counts as a hit.
+        params = dict(params or {}, **kwargs)
+        key = self.key(stage, fn, deps, params)
+
+        found, value = self._load(key)
+        if not found:
+            with self._key_lock(key):
+                try:
+                    found, value = self._load(key)
+                    if not found:
+                        self._record(stage, key, hit=False)
+                        start = time.perf_counter()
+                        value = fn(*resolve_args(), **kwargs)
+                        self._record_compute(stage, round(time.perf_counter() - start, 3))
+                        self._store(key, value)
+                        self._evict()
+                        return value, key, False
+                finally:
+                    # Threads already waiting hold the lock object; later
+                    # misses on this key (after eviction) start a new one
+                    with self._lock:
+                        self._key_locks.pop(key, None)
+        self._record(stage, key, hit=True)
+        return value, key, True
+
+    def _key_lock(self, key):
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _path(self, key, ext):
+        return os.path.join(self.root, key + ext)
+
+    def _load(self, key):
+        # A tuple value (e.g. dedup's (frame, report)) is a '.tuple' manifest
+        # holding its length, with each member stored under key.<i>
+        tuple_path = self._path(key, '.tuple')
+        if os.path.exists(tuple_path):
+            found, length = self._load_file(tuple_path, '.tuple')
+            members = [self._load(f"{key}.{i}") for i in range(length)] if found else []
+            if not found or not all(member_found for member_found, _ in members):
+                return False, None  # a member was evicted; recompute the stage
+            with suppress(FileNotFoundError):
+                os.utime(tuple_path)
+            return True, tuple(member for _, member in members)
+        for ext in ('.parquet', '.pkl'):
+            path = self._path(key, ext)
+            if os.path.exists(path):
+                return self._load_file(path, ext)
+        return False, None
+
+    def _load_file(self, path, ext):
+        try:
+            if ext == '.parquet':
+                value = pd.read_parquet(path)
+            else:
+                with open(path, 'rb') as f:
+                    value = pickle.load(f)
+        except FileNotFoundError:  # evicted by another thread since the exists check
+            return False, None
+        except Exception:
+            with suppress(FileNotFoundError):
+                os.remove(path)  # corrupt or from an incompatible version
+            return False, None
+        with suppress(FileNotFoundError):
+            os.utime(path)  # mark as recently used for LRU eviction
+        return True, value
+
+    def _store(self, key, value):
+        if isinstance(value, tuple):
+            # Members first, manifest last: the manifest is what makes it a hit
+            for i, member in enumerate(value):
+                self._store(f"{key}.{i}", member)
+            self._store_pickle(key, len(value), '.tuple')
+            return
+        if isinstance(value, pd.DataFrame):
+            tmp = self._temp_path(key)
+            try:
+                value.to_parquet(tmp)
+                os.replace(tmp, self._path(key, '.parquet'))
+                return
+            except Exception:  # columns Parquet can't represent; fall back to pickle
+                with suppress(FileNotFoundError):
+                    os.remove(tmp)
+        self._store_pickle(key, value, '.pkl')
+
+    def _store_pickle(self, key, value, ext):
+        tmp = self._temp_path(key)
+        try:
+            with open(tmp, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._path(key, ext))
+        except BaseException:
+            with suppress(FileNotFoundError):
+                os.remove(tmp)
+            raise
+
+    def _temp_path(self, key):
+        # Unique per writer, so two processes storing the same key never share
+        # a temp file; the final os.replace is atomic
+        fd, tmp = tempfile.mkstemp(dir=self.root, prefix=key + '.', suffix='.tmp')
+        os.close(fd)
+        return tmp
+
+    def _entries(self):
+        entries = []
+        for name in os.listdir(self.root):
+            if name.endswith('.tmp'):
+                continue
+            path = os.path.join(self.root, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:  # removed by another thread or process
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self):
+        with self._lock:
+            entries = sorted(self._entries())
+            total = sum(size for _, size, _ in entries)
+            while entries and total > self.max_bytes:
+                _, size, path = entries.pop(0)
+                with suppress(FileNotFoundError):
+                    os.remove(path)
+                total -= size
+
+    def _stats_entry(self, stage):
+        return self.stats.setdefault(stage, {'hits': 0, 'misses': 0, 'compute_s': None, 'key': None})
+
+    def _record(self, stage, key, hit):
+        with self._lock:
+            entry = self._stats_entry(stage)
+            entry['hits' if hit else 'misses'] += 1
+            entry['key'] = key
+
+    def _record_compute(self, stage, seconds):
+        with self._lock:
+            self._stats_entry(stage)['compute_s'] = seconds
+
+    def size_bytes(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def stats_frame(self):
+        rows = [dict(stage=stage, **entry) for stage, entry in self.stats.items()]
+        return pd.DataFrame(rows, columns=['stage', 'hits', 'misses', 'compute_s', 'key'])
+
+    def clear(self):
+        with self._lock:
+            for _, _, path in self._entries():
+                with suppress(FileNotFoundError):
+                    os.remove(path)
+            self.stats.clear()
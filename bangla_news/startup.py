@@ -0,0 +1,99 @@
+# startup.py
+import argparse
+import ast
+import json
+import os
+import subprocess
+import sys
+
+import pandas as pd
+
+# ---------------------------
+# Startup measurements
+# ---------------------------
+# python -m bangla_news.startup cse400c.py
+#
+# For every page of a Streamlit app, each in a fresh interpreter:
+#
+#   import_s   cold import time of the page's top-level imports, plus those
+#              of the entry script (what the first visit to the page pays)
+#   run_s      for the default page, the cold first run: time until the app
+#              is fully drawn after the server starts. For the others, the
+#              run after switching to them from the default page (AppTest
+#              runs a switched-to page without the entry script).
+#   heavy      heavy libraries imported by then
+#
+# A single-file app is measured as one default page. Pipeline stages come
+# from the stage cache, so run the app once first to measure warm reruns.
+HEAVY = ['torch', 'transformers', 'plotly', 'seaborn', 'wordcloud', 'gdown']
+
+
+def top_level_imports(path):
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    nodes = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+    return ast.unparse(ast.Module(body=nodes, type_ignores=[]))
+
+
+def registered_pages(entry):
+    # (page file, is default) for every st.Page("...") in the entry script
+    with open(entry, encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    pages = [node for node in ast.walk(tree)
+             if isinstance(node, ast.Call) and getattr(node.func, 'attr', None) == 'Page'
+             and node.args and isinstance(node.args[0], ast.Constant)]
+    return [(node.args[0].value,
+             any(k.arg == 'default' and getattr(k.value, 'value', False) for k in node.keywords))
+            for node in pages]
+
+
+_IMPORT_PROBE = """
+import sys, time
+sys.path.insert(0, {root!r})
+started = time.perf_counter()
+exec(compile({code!r}, 'imports', 'exec'))
+print(time.perf_counter() - started)
+"""
+
+_RUN_PROBE = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({entry!r}, default_timeout={timeout})
+started = time.perf_counter()
+at.run()
+if not {default!r}:
+    started = time.perf_counter()
+    at.switch_page({page!r}).run()
+print(json.dumps({{'run_s': time.perf_counter() - started, 'exceptions': len(at.exception),
+                  'heavy': [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def _probe(code):
+    out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    return out.stdout.strip().splitlines()[-1]
+
+
+def measure(entry, timeout=900):
+    entry = os.path.abspath(entry)
+    root = os.path.dirname(entry)
+    entry_imports = top_level_imports(entry)
+    rows = []
+    for page, default in registered_pages(entry) or [(None, True)]:
+        code = entry_imports
+        if page:
+            code += "\n" + top_level_imports(os.path.join(root, page))
+        import_s = float(_probe(_IMPORT_PROBE.format(root=root, code=code)))
+        run = json.loads(_probe(_RUN_PROBE.format(root=root, entry=entry, page=page, default=default,
+                                                  timeout=timeout, heavy=HEAVY)))
+        rows.append({'page': page or os.path.basename(entry), 'default': default, 'import_s': import_s, **run})
+    return pd.DataFrame(rows)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Cold import and run time per page")
+    parser.add_argument('entry')
+    parser.add_argument('--timeout', type=int, default=900)
+    args = parser.parse_args()
+    print(measure(args.entry, args.timeout).to_string(index=False))
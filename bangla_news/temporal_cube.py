@@ -0,0 +1,113 @@
+# temporal_cube.py
+import numpy as np
+import pandas as pd
+
+# ---------------------------
+# Temporal count cube
+# ---------------------------
+# One dense count array over (category, year, month, weekday, hour), built in
+# a single bincount. Every temporal chart is a sum over some of its axes, and
+# filters (category subset, month range) just mask or slice the array, so
+# the corpus is never rescanned.
+AXES = ('category', 'year', 'month', 'weekday', 'hour')
+WEEKDAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+MONTHS = list(range(1, 13))
+HOURS = list(range(24))
+
+
+class TemporalCube:
+    def __init__(self, counts, categories, years):
+        self.counts = counts          # int64, (C, Y, 12, 7, 24)
+        self.categories = list(categories)
+        self.years = np.asarray(years)
+
+    @classmethod
+    def from_datetimes(cls, datetimes, categories):
+        datetimes = pd.DatetimeIndex(datetimes)
+        parsed = ~datetimes.isna()
+        datetimes = datetimes[parsed]
+        codes, names = pd.factorize(np.asarray(categories, dtype=object)[parsed], sort=True)
+
+        if len(datetimes):
+            first_year, last_year = int(datetimes.year.min()), int(datetimes.year.max())
+        else:
+            first_year, last_year = 0, -1
+        years = np.arange(first_year, last_year + 1)
+
+        shape = (len(names), len(years), 12, 7, 24)
+        flat = np.ravel_multi_index(
+            (codes, datetimes.year.to_numpy() - first_year, datetimes.month.to_numpy() - 1,
+             datetimes.weekday.to_numpy(), datetimes.hour.to_numpy()),
+            shape,
+        )
+        counts = np.bincount(flat, minlength=int(np.prod(shape))).reshape(shape)
+        return cls(counts, names, years)
+
+    @property
+    def total(self):
+        return int(self.counts.sum())
+
+    def month_range(self):
+        # (year, month) of the first and last non-empty month
+        per_month = self.counts.sum(axis=(0, 3, 4))
+        filled = np.argwhere(per_month > 0)
+        if not len(filled):
+            return None, None
+        (y0, m0), (y1, m1) = filled[0], filled[-1]
+        return (int(self.years[y0]), int(m0) + 1), (int(self.years[y1]), int(m1) + 1)
+
+    # ---------------------------
+    # Filters
+    # ---------------------------
+    def select(self, categories=None, start=None, end=None):
+        # categories: subset of category names; start / end: inclusive
+        # (year, month) bounds. Returns a new cube over the same axes.
+        counts = self.counts
+        names = self.categories
+        if categories is not None:
+            keep = [self.categories.index(c) for c in categories]
+            counts = counts[keep]
+            names = [self.categories[i] for i in keep]
+        if start is not None or end is not None:
+            month_index = self.years[:, None] * 12 + np.arange(12)[None, :]
+            mask = np.ones(month_index.shape, dtype=bool)
+            if start is not None:
+                mask &= month_index >= start[0] * 12 + start[1] - 1
+            if end is not None:
+                mask &= month_index <= end[0] * 12 + end[1] - 1
+            counts = counts * mask[None, :, :, None, None]
+        return TemporalCube(counts, names, self.years)
+
+    # ---------------------------
+    # Aggregates
+    # ---------------------------
+    def _labels(self, axis):
+        return {
+            'category': self.categories,
+            'year': self.years.tolist(),
+            'month': MONTHS,
+            'weekday': WEEKDAYS,
+            'hour': HOURS,
+        }[axis]
+
+    def by(self, *axes, drop_empty=True):
+        # Counts summed over every axis not listed: by('year') is a Series,
+        # by('category', 'month') a DataFrame with categories as rows.
+        # drop_empty removes all-zero years, months and hours like a groupby
+        # would; categories and weekdays are always kept.
+        keep = [AXES.index(a) for a in axes]
+        summed = self.counts.sum(axis=tuple(i for i in range(len(AXES)) if i not in keep))
+        if len(axes) == 1:
+            result = pd.Series(summed, index=pd.Index(self._labels(axes[0]), name=axes[0]))
+            if drop_empty and axes[0] in ('year', 'month', 'hour'):
+                result = result[result > 0]
+            return result
+        row_axis, col_axis = axes
+        result = pd.DataFrame(summed, index=pd.Index(self._labels(row_axis), name=row_axis),
+                              columns=pd.Index(self._labels(col_axis), name=col_axis))
+        if drop_empty:
+            if row_axis in ('year', 'month', 'hour'):
+                result = result[result.sum(axis=1) > 0]
+            if col_axis in ('year', 'month', 'hour'):
+                result = result.loc[:, result.sum(axis=0) > 0]
+        return result
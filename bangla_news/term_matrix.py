@@ -0,0 +1,132 @@
+# term_matrix.py
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+# ---------------------------
+# Sparse category x term count matrix
+# ---------------------------
+# Most words occur in only a few categories, so the matrix is stored as CSR:
+# row c holds the word ids that occur in category c and their counts.
+def build_category_term_matrix(store):
+    n_categories, vocab_size = len(store.categories), store.vocab_size
+    # The store is grouped by category, so the category of every token is a repeat
+    token_offsets = store.offsets[store.category_bounds]
+    token_category = np.repeat(np.arange(n_categories, dtype=np.int64), np.diff(token_offsets))
+
+    keys, counts = np.unique(token_category * vocab_size + store.ids, return_counts=True)
+    rows, cols = np.divmod(keys, max(vocab_size, 1))
+    return sparse.csr_matrix((counts.astype(np.int64), (rows, cols)), shape=(n_categories, vocab_size))
+
+
+SCORES = ['log_odds', 'chi2', 'tfidf', 'share']
+
+
+class CategoryTermMatrix:
+    def __init__(self, counts, vocab, categories):
+        self.counts = counts.tocsr()
+        self.vocab = vocab
+        self.categories = list(categories)
+        self._scores = None
+
+    @property
+    def category_totals(self):
+        return np.asarray(self.counts.sum(axis=1)).ravel()
+
+    @property
+    def term_totals(self):
+        return np.asarray(self.counts.sum(axis=0)).ravel()
+
+    @property
+    def categories_per_term(self):
+        # Column non-zero count: in how many categories each word occurs
+        return np.diff(self.counts.tocsc().indptr)
+
+    # ---------------------------
+    # Strict unique words (exactly one category)
+    # ---------------------------
+    def unique_words(self):
+        single = self.categories_per_term == 1
+        unique_words_by_category = {}
+        for c, category in enumerate(self.categories):
+            row = self.counts.indices[self.counts.indptr[c]:self.counts.indptr[c + 1]]
+            unique_ids = row[single[row]]
+            if len(unique_ids):
+                unique_words_by_category[category] = self.vocab[unique_ids].tolist()
+        return unique_words_by_category
+
+    # ---------------------------
+    # Distinctiveness scores
+    # ---------------------------
+    # One row per non-zero (category, word) cell, all computed vectorized over
+    # the CSR data array:
+    #   share     fraction of the word's occurrences that fall in this category
+    #   log_odds  z-scored log-odds ratio of this category vs. the rest, with
+    #             an informative Dirichlet prior from corpus frequencies
+    #   chi2      2x2 chi-square of (category, rest) x (word, other words)
+    #   tfidf     within-category frequency x inverse category frequency
+    def scores(self, prior=0.1):
+        if self._scores is not None:
+            return self._scores
+        X = self.counts
+        n_categories = len(self.categories)
+        rows = np.repeat(np.arange(n_categories), np.diff(X.indptr))
+        cols = X.indices
+        a = X.data.astype(np.float64)
+
+        category_total = self.category_totals.astype(np.float64)[rows]
+        term_total = self.term_totals.astype(np.float64)[cols]
+        n_total = float(X.sum())
+        n_cats = self.categories_per_term[cols]
+
+        # Log-odds ratio with informative Dirichlet prior (Monroe et al., 2008)
+        alpha_w = prior * term_total
+        alpha_0 = prior * n_total
+        rest = term_total - a
+        rest_total = n_total - category_total
+        delta = (np.log((a + alpha_w) / (category_total + alpha_0 - a - alpha_w))
+                 - np.log((rest + alpha_w) / (rest_total + alpha_0 - rest - alpha_w)))
+        log_odds = delta / np.sqrt(1.0 / (a + alpha_w) + 1.0 / (rest + alpha_w))
+
+        # 2x2 chi-square
+        b = category_total - a
+        c = rest
+        d = rest_total - rest
+        denominator = (a + b) * (c + d) * (a + c) * (b + d)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            chi2 = np.where(denominator > 0, n_total * (a * d - b * c) ** 2 / denominator, 0.0)
+
+        # TF-IDF with categories as documents (smoothed idf)
+        idf = np.log((1 + n_categories) / (1 + n_cats)) + 1
+        tfidf = a / np.maximum(category_total, 1) * idf
+
+        self._scores = pd.DataFrame({
+            'category': rows.astype(np.int32),
+            'word_id': cols.astype(np.int32),
+            'count': X.data,
+            'total': term_total.astype(np.int64),
+            'n_categories': n_cats,
+            'share': a / term_total,
+            'log_odds': log_odds,
+            'chi2': chi2,
+            'tfidf': tfidf,
+        })
+        return self._scores
+
+    def mostly_unique(self, min_share=0.9, min_count=5, max_categories=None, score='log_odds', top_n=20):
+        # Relaxed version of unique_words: a word counts for a category when at
+        # least min_share of its occurrences fall there. Only the rows that are
+        # returned get decoded to strings.
+        df = self.scores()
+        mask = (df['share'] >= min_share) & (df['total'] >= min_count)
+        if max_categories is not None:
+            mask &= df['n_categories'] <= max_categories
+        selected = df[mask].sort_values(['category', score], ascending=[True, False], kind='stable')
+        selected = selected.groupby('category', sort=False).head(top_n)
+
+        result = {}
+        for c, group in selected.groupby('category', sort=False):
+            group = group.drop(columns='category')
+            group.insert(0, 'word', self.vocab[group.pop('word_id').to_numpy()])
+            result[self.categories[c]] = group.reset_index(drop=True)
+        return result
@@ -0,0 +1,133 @@
+# token_store.py
+from array import array
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+# ---------------------------
+# Integer-encoded token store
+# ---------------------------
+# Replaces the token_list column (a Python list of Python str per article)
+# with one shared vocabulary, a flat int32 array of token ids and int64
+# per-document offsets. Documents are stored grouped by category, so every
+# category is one contiguous range of ids and can be sliced without copying.
+#
+#   ids[offsets[k]:offsets[k + 1]]   tokens of stored document k
+#   order[k]                         original row of stored document k
+#   position[row]                    stored document of original row
+class TokenStore:
+    def __init__(self, vocab, ids, offsets, categories, category_bounds, order):
+        self.vocab = vocab                      # object array, id -> token
+        self.ids = ids                          # int32, all tokens back to back
+        self.offsets = offsets                  # int64, n_docs + 1
+        self.categories = categories            # category names, in order of first appearance
+        self.category_bounds = category_bounds  # stored docs of category c: [bounds[c], bounds[c + 1])
+        self.order = order
+        self.position = np.empty_like(order)
+        self.position[order] = np.arange(len(order))
+        self._vocab_index = None
+
+    @classmethod
+    def from_texts(cls, texts, categories):
+        values = np.asarray(texts, dtype=object)
+        codes, uniques = pd.factorize(np.asarray(categories, dtype=object), sort=False)
+        order = np.argsort(codes, kind='stable')
+
+        vocab_index = {}
+        ids = array('i')
+        lengths = np.zeros(len(values), dtype=np.int64)
+        for k, row in enumerate(order):
+            text = values[row]
+            tokens = text.split() if isinstance(text, str) else []
+            lengths[k] = len(tokens)
+            ids.extend([vocab_index.setdefault(t, len(vocab_index)) for t in tokens])
+
+        offsets = np.zeros(len(values) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        vocab = np.empty(len(vocab_index), dtype=object)
+        vocab[:] = list(vocab_index)
+        bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1)).astype(np.int64)
+
+        store = cls(vocab, np.frombuffer(ids, dtype=np.int32).copy(), offsets,
+                    list(uniques), bounds, order.astype(np.int64))
+        store._vocab_index = vocab_index
+        return store
+
+    # ---------------------------
+    # Sizes
+    # ---------------------------
+    @property
+    def n_docs(self):
+        return len(self.order)
+
+    @property
+    def vocab_size(self):
+        return len(self.vocab)
+
+    @property
+    def nbytes(self):
+        return self.ids.nbytes + self.offsets.nbytes + self.order.nbytes + self.position.nbytes
+
+    @property
+    def vocab_index(self):
+        if self._vocab_index is None:
+            self._vocab_index = {token: i for i, token in enumerate(self.vocab)}
+        return self._vocab_index
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_vocab_index'] = None  # rebuilt on demand
+        return state
+
+    # ---------------------------
+    # Zero-copy slicing
+    # ---------------------------
+    def category_code(self, category):
+        return self.categories.index(category)
+
+    def category_docs(self, category):
+        c = self.category_code(category)
+        return int(self.category_bounds[c]), int(self.category_bounds[c + 1])
+
+    def category_ids(self, category):
+        start, end = self.category_docs(category)
+        return self.ids[self.offsets[start]:self.offsets[end]]
+
+    def category_offsets(self, category):
+        # Offsets into category_ids(category), n_docs_in_category + 1 long
+        start, end = self.category_docs(category)
+        return self.offsets[start:end + 1] - self.offsets[start]
+
+    def doc_ids(self, row):
+        k = self.position[row]
+        return self.ids[self.offsets[k]:self.offsets[k + 1]]
+
+    # ---------------------------
+    # Decoding / compatibility views
+    # ---------------------------
+    def encode(self, tokens):
+        index = self.vocab_index
+        return np.array([index.get(t, -1) for t in tokens], dtype=np.int32)
+
+    def decode(self, ids):
+        return self.vocab[np.asarray(ids)].tolist()
+
+    def tokens(self, row):
+        return self.decode(self.doc_ids(row))
+
+    def doc_categories(self):
+        # Category name per original row
+        codes = np.repeat(np.arange(len(self.categories)), np.diff(self.category_bounds))
+        names = np.asarray(self.categories, dtype=object)[codes]
+        return names[self.position]
+
+    def preview(self, n=5):
+        # Stand-in for df_balanced[['category', 'token_list']].head(n)
+        rows = np.arange(min(n, self.n_docs))
+        categories = self.doc_categories()[rows]
+        return pd.DataFrame({'category': categories, 'token_list': [self.tokens(r) for r in rows]})
+
+    def to_arrow(self):
+        # LargeListArray over the stored (category-grouped) document order
+        return pa.LargeListArray.from_arrays(pa.array(self.offsets), pa.array(self.ids))
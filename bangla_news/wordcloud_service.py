@@ -0,0 +1,94 @@
+# wordcloud_service.py
+import io
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from .stage_cache import fingerprint
+
+# ---------------------------
+# Background word cloud rendering
+# ---------------------------
+# WordCloud layout is CPU-heavy, so images are rendered by a small thread
+# pool as soon as a page hands over the frequency tables of all categories,
+# not when one is picked. Finished PNGs stay in a bounded LRU cache keyed by
+#
+#   (category, fingerprint of the frequency table, font_path)
+#
+# so unigram and bigram tables of a category are separate entries and new
+# counts or another font render afresh. Layout uses a fixed random_state,
+# so a key always maps to the same picture.
+def render_wordcloud(frequencies, font_path=None, width=1000, height=500, max_words=100, random_state=42):
+    from wordcloud import WordCloud
+    wc = WordCloud(
+        font_path=font_path,
+        width=width,
+        height=height,
+        background_color='white',
+        max_words=max_words,
+        random_state=random_state,
+    ).generate_from_frequencies(frequencies)
+    buffer = io.BytesIO()
+    wc.to_image().save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+class WordCloudService:
+    def __init__(self, workers=2, max_entries=128, **options):
+        self.options = options  # passed on to render_wordcloud
+        self.max_entries = max_entries
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='wordcloud')
+        self._images = OrderedDict()  # key -> PNG bytes
+        self._pending = {}  # key -> Future
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(category, frequencies, font_path=None):
+        return (category, fingerprint(frequencies), font_path)
+
+    def submit(self, category, frequencies, font_path=None):
+        # Queues a render unless the image is cached or already queued
+        key = self.key(category, frequencies, font_path)
+        with self._lock:
+            if key in self._images or key in self._pending:
+                return key
+            future = self._pool.submit(render_wordcloud, frequencies, font_path, **self.options)
+            self._pending[key] = future
+        future.add_done_callback(lambda f: self._finish(key, f))
+        return key
+
+    def _finish(self, key, future):
+        with self._lock:
+            self._pending.pop(key, None)
+            if future.cancelled() or future.exception() is not None:
+                return  # get() re-raises from the future it waits on
+            self._images[key] = future.result()
+            while len(self._images) > self.max_entries:
+                self._images.popitem(last=False)
+
+    def prefetch(self, tables, font_path=None, first=None):
+        # tables is {category: frequencies}; first is queued ahead of the
+        # others. Empty tables are skipped. Returns {category: key}.
+        order = sorted(tables, key=lambda category: category != first)
+        return {category: self.submit(category, tables[category], font_path)
+                for category in order if tables[category]}
+
+    def is_ready(self, key):
+        return key in self._images
+
+    def get(self, category, frequencies, font_path=None, timeout=None):
+        # PNG bytes; only waits if this image is still being rendered
+        key = self.submit(category, frequencies, font_path)
+        with self._lock:
+            image = self._images.get(key)
+            if image is not None:
+                self._images.move_to_end(key)
+                return image
+            future = self._pending.get(key)
+        if future is None:  # finished and already evicted again
+            return render_wordcloud(frequencies, font_path, **self.options)
+        return future.result(timeout)
+
+    def clear(self):
+        with self._lock:
+            self._images.clear()
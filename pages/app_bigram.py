@@ -0,0 +1,81 @@
+# app_bigram.py
+import streamlit as st
+import plotly.express as px
+import os
+import matplotlib.font_manager as fm
+from bangla_news import app_state
+from bangla_news.app_state import show_plotly
+
+st.title("Bangla News: Top Bigram Words per Category")
+
+pipeline = app_state.pipeline()
+instrumentation = app_state.instrumentation()
+
+# ---------------------------
+# Token store and n-gram counts from the shared pipeline
+# ---------------------------
+token_store = pipeline.get('tokenize')
+ngram_counts = pipeline.get('ngram_counts')
+st.subheader("Tokenized Dataset Sample")
+st.dataframe(token_store.preview(5))
+
+# ---------------------------
+# Top 30 bigrams (or trigrams) per category (from the shared n-gram tables)
+# ---------------------------
+ngram_labels = {2: ("Bigram", "বাইগ্রাম"), 3: ("Trigram", "ট্রাইগ্রাম")}
+ngram_order = st.radio("N-gram order", list(ngram_labels), format_func=lambda n: ngram_labels[n][0], horizontal=True)
+ngram_name, ngram_name_bn = ngram_labels[ngram_order]
+ngram_column = ngram_name.lower()  # 'bigram' / 'trigram'
+
+ngram_df = instrumentation.call(f'top_{ngram_order}grams', ngram_counts.top_k_frame, 30, n=ngram_order,
+                                column=ngram_column)
+
+st.subheader(f"Top 30 {ngram_name}s per Category")
+st.dataframe(ngram_df.head(10))
+
+# ---------------------------
+# Bar Chart for Bigram
+# ---------------------------
+font_path = "/Users/ronjonkar/Desktop/Streamlit/NotoSansBengali-Regular.ttf"  # adjust for your system
+fallback_font_family = "Noto Sans Bengali"
+
+if os.path.exists(font_path):
+    fm.fontManager.addfont(font_path)
+    font_family = fallback_font_family
+else:
+    st.warning("Font file not found. Using fallback font.")
+    font_family = "Nikosh"
+
+def draw_top_ngrams(cat_df, title, ngram_column, ngram_name, font_family):
+    fig = px.bar(
+        cat_df,
+        x='frequency',
+        y=ngram_column,
+        orientation='h',
+        title=title,
+        labels={'frequency': 'Frequency', ngram_column: ngram_name},
+        text='frequency',
+        color='frequency',
+        color_continuous_scale='Viridis'
+    )
+
+    fig.update_traces(textposition='outside')
+    fig.update_layout(
+        yaxis={'categoryorder': 'total ascending'},
+        font=dict(family=font_family, size=16),
+        coloraxis_colorbar=dict(title="ঘনত্ব")
+    )
+    return fig
+
+st.subheader(f"Top 15 {ngram_name}s Bar Charts per Category")
+
+for category in ngram_df['category'].unique():
+    cat_df = (
+        ngram_df[ngram_df['category'] == category]
+        .sort_values(by='frequency', ascending=False)
+        .head(15)
+        .sort_values(by='frequency', ascending=True)  # horizontal plot
+    )
+
+    show_plotly(draw_top_ngrams, cat_df, title=f"শ্রেণী: {category} - শীর্ষ ১৫ {ngram_name_bn}",
+                ngram_column=ngram_column, ngram_name=ngram_name, font_family=font_family)
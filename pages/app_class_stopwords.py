@@ -0,0 +1,74 @@
+# app_class_stopwords.py
+import streamlit as st
+import re
+from bangla_news import app_state
+from bangla_news.pipeline import CLASS_WORD_MAP
+from bangla_news.text_cleaning import benchmark_class_words
+
+st.title("Bangla Class-Specific Stopword Removal & Tokenization")
+
+pipeline = app_state.pipeline()
+
+# ---------------------------
+# Cleaned dataset from the previous step
+# ---------------------------
+df_cleaned = pipeline.get('clean_text')
+st.subheader("Dataset Before Class-Specific Stopword Removal")
+st.dataframe(df_cleaned[['category', 'cleaned_content']].head(5))
+
+# ---------------------------
+# Words to remove per class
+# ---------------------------
+# CLASS_WORD_MAP lives in pipeline.py; it is a parameter of the class_words stage
+
+# ---------------------------
+# Function to remove class-specific words
+# ---------------------------
+# Row-wise reference version, kept for the benchmark below. The pipeline uses
+# remove_class_words_grouped, which matches whole tokens only.
+def remove_class_words(row):
+    text = row['cleaned_content']
+    class_name = row['category']
+
+    if class_name in CLASS_WORD_MAP:
+        for word in CLASS_WORD_MAP[class_name]:
+            text = text.replace(word, '')
+        text = re.sub(r'\s+', ' ', text).strip()
+    return text
+
+# ---------------------------
+# Apply to DataFrame
+# ---------------------------
+st.write("Removing class-specific words...")
+df_class_words = pipeline.get('class_words')
+
+st.subheader("Dataset After Class-Specific Stopword Removal")
+st.dataframe(df_class_words[['category', 'cleaned_content']].head(5))
+
+# Both versions run on the text before removal, as the class_words stage does
+with st.expander("Benchmark: grouped vs row-wise class word removal"):
+    bench_rows = st.number_input("Rows", min_value=1_000, max_value=1_000_000, value=100_000, step=10_000)
+    if st.button("Run benchmark"):
+        st.write(benchmark_class_words(df_cleaned, CLASS_WORD_MAP, remove_class_words, n_rows=int(bench_rows)))
+
+# ---------------------------
+# Tokenization
+# ---------------------------
+# Tokens go into a TokenStore (shared vocabulary + flat int32 id array +
+# per-document offsets, grouped by category) instead of a token_list column
+# holding a Python list per article. All counting pages work on it.
+st.write("Tokenizing cleaned content into words...")
+token_store = pipeline.get('tokenize')
+
+st.subheader("Dataset with Token Lists")
+st.dataframe(token_store.preview(5))
+st.write(f"Token store: {len(token_store.ids):,} tokens, {token_store.vocab_size:,} word types, "
+         f"{token_store.nbytes / 1024**2:.1f} MB")
+
+# ---------------------------
+# N-gram counts per category
+# ---------------------------
+# One grouped pass over the token store gives the unigram and bigram tables
+# for every category; the counting pages only query them.
+st.write("Counting unigrams and bigrams per category...")
+pipeline.get('ngram_counts')
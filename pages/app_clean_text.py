@@ -0,0 +1,34 @@
+# app_clean_text.py
+import streamlit as st
+from bangla_news import app_state
+from bangla_news.app_state import show_frame_info
+
+st.title("Bangla Text Cleaning & Tokenization")
+
+pipeline = app_state.pipeline()
+
+# ---------------------------
+# Balanced dataset from the data processing step
+# ---------------------------
+df_balanced = pipeline.get('balance')
+st.subheader("Balanced Dataset Info Before Cleaning")
+show_frame_info('clean_text', 'df_balanced (before)', df_balanced)
+st.dataframe(df_balanced.head(5))
+
+# ---------------------------
+# Bangla Stopword List & Cleaning Function
+# ---------------------------
+# raw_stopwords, bangla_stopwords and clean_text live in text_cleaning.py so
+# the batch engine's worker processes can import them. stopword_matcher is
+# the compiled single-pass filter that also removes multi-word stopwords.
+
+# ---------------------------
+# Apply cleaning on balanced dataset
+# ---------------------------
+st.write("Cleaning text... this may take a few seconds for large datasets.")
+df_balanced = pipeline.get('clean_text')
+
+st.subheader("Dataset After Cleaning")
+st.dataframe(df_balanced[['content', 'cleaned_content']].head(10))
+st.write("Total rows:", df_balanced.shape[0])
+show_frame_info('clean_text', 'df_balanced', df_balanced)
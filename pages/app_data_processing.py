@@ -0,0 +1,87 @@
+# app_data_processing.py
+import streamlit as st
+import seaborn as sns
+from bangla_news import app_state
+from bangla_news.app_state import show_frame_info, show_pyplot
+
+# ---------------------------
+# Page title
+# ---------------------------
+st.title("Bangla News Data Processing & Visualization")
+
+# ---------------------------
+# Datasets 1 and 2 from the shared pipeline
+# ---------------------------
+pipeline = app_state.pipeline()
+df1 = pipeline.get('dataset1')
+df2 = pipeline.get('dataset2')
+
+st.subheader("Initial Dataset Info")
+st.write("Dataset 1 info:")
+show_frame_info('data_processing', 'df1', df1)
+st.dataframe(df1.head())
+
+st.write("Dataset 2 info:")
+show_frame_info('data_processing', 'df2', df2)
+st.dataframe(df2.head())
+
+# ---------------------------
+# Deduplicate the combined corpus
+# ---------------------------
+# pipeline.combine_datasets drops unused columns and concatenates both
+# datasets; dedup.py then removes exact 64-bit content hashes, hashes of
+# normalized content and MinHash/LSH near-duplicates at the threshold set in
+# the sidebar. Runs once over both datasets, so articles present in both are
+# caught too.
+df, dedup_report = pipeline.get('dedup')
+# The per-dataset frames and the pre-dedup frame are on disk in the stage
+# cache; drop the references so only one copy of the corpus stays alive
+pipeline.drop('dataset1', 'dataset2', 'combine')
+del df1, df2
+st.subheader("Deduplication")
+st.write(f"Removed {int(dedup_report['rows_removed'].sum())} duplicate articles "
+         f"(similarity threshold {pipeline.dedup_threshold}); "
+         "cross_dataset counts rows whose kept copy came from the other dataset.")
+st.dataframe(dedup_report)
+
+st.subheader("Combined Dataset Info")
+show_frame_info('dedup', 'df', df)
+st.write("Category counts before balancing:")
+st.write(df['category'].value_counts())
+
+# ---------------------------
+# Plot histogram of categories
+# ---------------------------
+def draw_category_distribution(fig, category_counts, title):
+    fig.set_size_inches(10, 6)
+    ax = fig.subplots()
+    sns.barplot(x=category_counts.index, y=category_counts.values, palette='magma', ax=ax)
+    ax.set_title(title)
+    ax.set_xlabel('Category')
+    ax.set_ylabel('Count')
+    ax.tick_params(axis='x', labelrotation=45)
+    fig.tight_layout()
+
+show_pyplot(draw_category_distribution, df['category'].value_counts(),
+            title='News Category Distribution (Before Balancing)')
+
+# ---------------------------
+# Balance classes
+# ---------------------------
+# balancing.py picks row positions per category and gathers them with a
+# single take; 'last' keeps the original rule (last target_size rows of each
+# category, then the same seed-42 shuffle). Target size and strategy are set
+# in the sidebar.
+df_balanced = pipeline.get('balance')
+
+st.subheader("Balanced Dataset Info")
+show_frame_info('balance', 'df_balanced', df_balanced)
+st.write("Category counts after balancing:")
+st.write(df_balanced['category'].value_counts())
+st.write("Shape:", df_balanced.shape)
+
+# ---------------------------
+# Plot histogram after balancing
+# ---------------------------
+show_pyplot(draw_category_distribution, df_balanced['category'].value_counts(),
+            title='News Category Distribution (After Balancing)')
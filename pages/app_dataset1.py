@@ -0,0 +1,47 @@
+# app_dataset1.py
+import streamlit as st
+import os
+from bangla_news import app_state
+from bangla_news.app_state import show_frame_info, show_pyplot
+from bangla_news.pipeline import DATASETS
+
+# ---------------------------
+# Page title
+# ---------------------------
+st.title("Bangla Newspaper Dataset Analysis")
+
+# ---------------------------
+# Download if not exists, then load and clean dataset
+# ---------------------------
+# The pipeline downloads the file with gdown when the stage first needs it.
+# pipeline.load_dataset1 streams only the needed columns on first load and
+# writes a Parquet sidecar next to the JSON; later loads memory-map it.
+if os.path.exists(DATASETS['dataset1'][1]):
+    st.write("Dataset already exists.")
+    df1 = app_state.pipeline().get('dataset1')
+else:
+    with st.spinner("Downloading dataset..."):
+        df1 = app_state.pipeline().get('dataset1')
+
+# ---------------------------
+# Show dataset info
+# ---------------------------
+st.subheader("Cleaned Dataset Info")
+show_frame_info('dataset1', 'df1', df1)
+st.subheader("Sample Data")
+st.dataframe(df1.head())
+
+# ---------------------------
+# Plot category counts
+# ---------------------------
+def draw_category_counts(fig, category_counts):
+    fig.set_size_inches(12, 6)
+    ax = fig.subplots()
+    category_counts.plot(kind='bar', color='skyblue', ax=ax)
+    ax.set_title("Number of Articles per Category (Cleaned Dataset)", fontsize=16)
+    ax.set_xlabel("Category", fontsize=14)
+    ax.set_ylabel("Number of Articles", fontsize=14)
+    ax.tick_params(axis='x', labelrotation=45)
+
+st.subheader("Category Distribution")
+show_pyplot(draw_category_counts, df1['category'].value_counts())
@@ -0,0 +1,50 @@
+# app_dataset2.py
+import streamlit as st
+import seaborn as sns
+import os
+from bangla_news import app_state
+from bangla_news.app_state import show_frame_info, show_pyplot
+from bangla_news.pipeline import DATASETS
+
+# ---------------------------
+# Page title
+# ---------------------------
+st.title("Bangla Newspaper Dataset 2 Analysis")
+
+# ---------------------------
+# Download if not exists, then load dataset
+# ---------------------------
+# The pipeline downloads the file with gdown when the stage first needs it.
+# Multi-threaded Arrow reader, only the needed columns, string[pyarrow] text.
+if os.path.exists(DATASETS['dataset2'][1]):
+    st.write("Dataset 2 already exists locally. Skipping download.")
+    df2 = app_state.pipeline().get('dataset2')
+else:
+    with st.spinner("Downloading Dataset 2 (this may take a while)..."):
+        df2 = app_state.pipeline().get('dataset2')
+
+st.subheader("Dataset Info")
+show_frame_info('dataset2', 'df2', df2)
+st.subheader("Sample Data")
+st.dataframe(df2.head())
+
+# ---------------------------
+# Plot category distribution
+# ---------------------------
+def draw_category_distribution(fig, category_counts2):
+    fig.set_size_inches(10, 6)
+    ax = fig.subplots()
+    sns.barplot(x=category_counts2.index, y=category_counts2.values, palette='magma', ax=ax)
+
+    # Add frequency labels on top of bars
+    for container in ax.containers:
+        ax.bar_label(container, fmt='%d', label_type='edge')
+
+    ax.set_title('Dataset 2 News Category Distribution')
+    ax.set_xlabel('Category')
+    ax.set_ylabel('Count')
+    ax.tick_params(axis='x', labelrotation=45)
+    fig.tight_layout()
+
+st.subheader("Category Distribution")
+show_pyplot(draw_category_distribution, df2['category'].value_counts())
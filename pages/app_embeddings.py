@@ -0,0 +1,261 @@
+# app_embeddings.py
+import os
+import random
+from contextlib import nullcontext
+import numpy as np
+import streamlit as st
+import torch
+from transformers import AutoTokenizer, AutoModel
+from bangla_news import app_state
+from bangla_news.embedding_store import EmbeddingStore
+from bangla_news.semantic_index import IVFIndex
+from bangla_news.stage_cache import fingerprint
+from bangla_news.text_cleaning import clean_text
+from bangla_news.bert_encoder import (POOLINGS, compare_encoders, encode_sharded, encode_texts, encoder_pool,
+                                      merge_stats, quantize_model)
+
+st.title("Bangla News: BERT Embeddings")
+
+instrumentation = app_state.instrumentation()
+
+# ---------------------------
+# Use balanced dataset (after class-specific stopword removal)
+# ---------------------------
+df_balanced = app_state.pipeline().get('class_words')
+texts = df_balanced['cleaned_content'].tolist()
+st.write(f"Total articles to encode (balanced dataset): {len(texts)}")
+
+# ---------------------------
+# Load Bangla BERT model (cached)
+# ---------------------------
+@st.cache_resource
+def load_model(model_name="sagorsarker/bangla-bert-base"):
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModel.from_pretrained(model_name)
+    model.eval()
+    return tokenizer, model
+
+tokenizer, model = load_model()
+
+# ---------------------------
+# Determine device
+# ---------------------------
+if torch.backends.mps.is_available():
+    device = torch.device("mps")  # Mac GPU
+elif torch.cuda.is_available():
+    device = torch.device("cuda")
+else:
+    device = torch.device("cpu")
+
+st.write(f"Using device: {device}")
+
+model_name = "sagorsarker/bangla-bert-base"
+
+# ---------------------------
+# Pooling / output precision
+# ---------------------------
+pooling_names = {'cls': "CLS token", 'mean': "Mean (attention-masked)", 'max': "Max"}
+pooling = st.radio("Pooling", POOLINGS, horizontal=True, format_func=pooling_names.get)
+store_dtype = st.radio("Stored precision", ["float32", "float16"], horizontal=True)
+
+# ---------------------------
+# CPU inference mode
+# ---------------------------
+# On CPU the encoder can run with int8 dynamic quantization of its linear
+# layers, and/or sharded across worker processes that each hold their own
+# model copy with a pinned intra-op thread count (bert_encoder.py).
+quantize, workers = False, 1
+if device.type == "cpu":
+    cpu_mode = st.radio("CPU inference mode", ["fp32", "int8 dynamic quantization"], horizontal=True)
+    quantize = cpu_mode != "fp32"
+    workers = int(st.number_input("Worker processes", min_value=1, max_value=os.cpu_count() or 1, value=1))
+    if workers > 1:
+        st.write(f"{workers} workers x {max(1, (os.cpu_count() or 1) // workers)} threads each")
+
+@st.cache_resource
+def load_quantized_model(model_name="sagorsarker/bangla-bert-base"):
+    return quantize_model(load_model(model_name)[1])
+
+encoder_model = load_quantized_model(model_name) if quantize else model
+
+if device.type == "cpu" and st.button("Check int8 accuracy against fp32"):
+    sample = random.Random(42).sample(texts, min(64, len(texts)))
+    with st.spinner("Encoding sample with fp32 and int8 models..."):
+        accuracy = compare_encoders(model, load_quantized_model(model_name), tokenizer, sample, pooling=pooling)
+    st.write(
+        f"Cosine similarity ({pooling_names[pooling]} pooling) over {accuracy['samples']} articles: "
+        f"mean {accuracy['mean_cosine']:.5f}, min {accuracy['min_cosine']:.5f} "
+        f"(max abs difference {accuracy['max_abs_diff']:.4f})"
+    )
+
+# ---------------------------
+# Embedding store
+# ---------------------------
+# Vectors are kept on disk under .embeddings/, keyed by a hash of the article
+# text and the model name. Only articles that are not in the store yet get
+# encoded, each batch is committed as soon as it is done, and an interrupted
+# run picks up from the last finished batch. Each pooling / precision /
+# int8 combination gets its own store.
+
+@st.cache_resource
+def get_embedding_store(model_name, dim, dtype):
+    return EmbeddingStore(model_name, dim, dtype=dtype)
+
+store_name = model_name + "".join(f"#{part}" for part in (
+    pooling if pooling != 'cls' else None,
+    "int8" if quantize else None,
+    store_dtype if store_dtype != "float32" else None,
+) if part)
+embedding_store = get_embedding_store(store_name, model.config.hidden_size, store_dtype)
+
+# ---------------------------
+# Embedding job
+# ---------------------------
+# Length-bucketed batching (bert_encoder.py): texts are tokenized once,
+# sorted by length and batched by a token budget instead of a fixed
+# batch_size, so little compute goes into padding. Every batch is pooled and
+# written straight into out (a memmap over rows reserved in the store), in
+# input order, so memory stays flat however many articles are encoded.
+#
+# The encode runs on the shared job runner (jobs.py), outside the script
+# run, so it gets everything through its arguments and never reads widgets.
+# Chunks of 256 articles per worker are committed to the store one at a
+# time; progress is published and a cancel takes effect after each chunk.
+def encode_job(job, store, text_list, encoder, tokenizer, device, workers=1, quantize=False, **encode_options):
+    job.progress(0, None, "Looking up stored articles")
+    encode_stats = {}
+
+    # With several workers, the processes are started and load their model
+    # once for the whole job; every chunk is sent to the same pool
+    with encoder_pool(model_name, workers, quantize=quantize) if workers > 1 else nullcontext() as pool:
+        def get_embeddings(batch, out):
+            if pool is not None:
+                embeddings, stats = encode_sharded(model_name, batch, workers=workers, out=out, pool=pool,
+                                                   **encode_options)
+            else:
+                embeddings, stats = encode_texts(encoder, tokenizer, batch, device=device, out=out,
+                                                 **encode_options)
+            encode_stats.update(merge_stats(encode_stats, stats))
+            return embeddings
+
+        def update_progress(done, total):
+            job.progress(done, total, f"Encoded {done} / {total} missing articles")
+
+        embedding_rows, n_encoded = store.encode_missing(text_list, get_embeddings, batch_size=256 * workers,
+                                                         progress=update_progress)
+    return {'rows': embedding_rows, 'n_encoded': n_encoded, 'stats': encode_stats}
+
+text_keys = embedding_store.keys_for(texts)
+text_rows = embedding_store.lookup(text_keys)  # store row per article, -1 if missing
+cached_rows = int((text_rows >= 0).sum())
+st.write(f"Already in the embedding store: {cached_rows} / {len(texts)} "
+         f"({embedding_store.rows} vectors, {embedding_store.nbytes / 1024**2:.1f} MB on disk)")
+
+max_tokens = st.select_slider("Token budget per batch", options=[2048, 4096, 8192, 16384, 32768], value=8192)
+
+# ---------------------------
+# Compute embeddings in the background
+# ---------------------------
+# Keyed by store and article set: every session asking for the same vectors
+# sees (and can cancel) the one job already encoding them.
+job_runner = app_state.get_job_runner()
+embedding_job_key = ('embeddings', store_name, fingerprint(b"".join(text_keys)))
+embedding_job = job_runner.find(embedding_job_key)
+
+if st.button("Compute BERT Embeddings", disabled=embedding_job is not None and embedding_job.active):
+    embedding_job = job_runner.submit(
+        'embeddings', encode_job, embedding_store, texts, encoder_model, tokenizer, device, workers=workers,
+        quantize=quantize, max_length=256, max_tokens=max_tokens, pooling=pooling, dtype=store_dtype,
+        key=embedding_job_key,
+    )
+
+if embedding_job is not None:
+    app_state.show_job(embedding_job, "Computing embeddings for balanced dataset")
+    if embedding_job.status == 'done':
+        result = embedding_job.result
+        n_encoded, encode_stats = result['n_encoded'], result['stats']
+        text_rows = result['rows']
+        cached_rows = int((text_rows >= 0).sum())
+        st.success(f"Embeddings computed ✅ ({n_encoded} newly encoded, {len(texts) - n_encoded} from the store)")
+        st.write("Embeddings shape:", (len(text_rows), embedding_store.dim), embedding_store.dtype.name)
+        if encode_stats:
+            st.write(
+                f"{encode_stats['batches']} batches, padding efficiency "
+                f"{encode_stats['padding_efficiency']:.1%} (fixed batches of 64 in corpus order: "
+                f"{encode_stats['fixed_padding_efficiency']:.1%}), "
+                f"{encode_stats['tokens_per_second']:.0f} tokens/s, "
+                f"{encode_stats['sequences_per_second']:.1f} articles/s"
+            )
+
+# ---------------------------
+# Semantic search
+# ---------------------------
+# IVF index (semantic_index.py) over the vectors of the current embedding
+# store, saved next to it. Rows added to the store since the last visit are
+# appended to their nearest list; the index is rebuilt from scratch once the
+# store has doubled since the centroids were fitted.
+st.header("Semantic Search")
+
+@st.cache_resource
+def sync_semantic_index(store_path, store_rows):
+    index_path = os.path.join(store_path, "ivf")
+    index = IVFIndex.load(index_path)
+    if index is None or index.dim != embedding_store.dim or index.needs_rebuild() or len(index) > store_rows:
+        index = IVFIndex.build(embedding_store.matrix())
+    elif len(index) < store_rows:
+        index.add(embedding_store.matrix()[len(index):store_rows], np.arange(len(index), store_rows))
+    else:
+        return index
+    index.save(index_path)
+    return IVFIndex.load(index_path)
+
+if embedding_job is not None and embedding_job.active:
+    st.info("Semantic search is available once the embedding job has finished.")
+elif not cached_rows:
+    st.info("Compute embeddings first to enable semantic search.")
+else:
+    semantic_index = instrumentation.call('semantic_index', sync_semantic_index,
+                                          embedding_store.path, embedding_store.rows)
+    st.write(f"Index: {len(semantic_index)} vectors in {semantic_index.n_lists} lists")
+
+    # store row -> position in df_balanced
+    article_of_row = np.full(embedding_store.rows, -1, dtype=np.int64)
+    embedded = np.flatnonzero(text_rows >= 0)
+    article_of_row[text_rows[embedded]] = embedded
+
+    query_mode = st.radio("Query", ["Free text", "Article from the dataset"], horizontal=True)
+    top_k = st.slider("Results", 1, 50, 10)
+    n_probe = st.slider("Lists to probe (more = higher recall, slower)", 1, semantic_index.n_lists,
+                        min(8, semantic_index.n_lists))
+
+    query_vector, query_article = None, None
+    if query_mode == "Free text":
+        query_text = st.text_area("Query text")
+        if query_text.strip():
+            query_vector, _ = encode_texts(encoder_model, tokenizer, [clean_text(query_text)], device=device,
+                                           pooling=pooling)
+    else:
+        query_article = int(st.selectbox("Article", embedded,
+                                          format_func=lambda i: f"{i}: {df_balanced['category'].iloc[i]} - "
+                                                                f"{df_balanced['cleaned_content'].iloc[i][:80]}"))
+        query_vector = embedding_store.matrix()[text_rows[query_article]][None, :]
+
+    if query_vector is not None:
+        ids, scores = instrumentation.call('semantic_search', semantic_index.search, query_vector,
+                                           k=top_k + 1, n_probe=n_probe)
+        positions = article_of_row[ids[0][ids[0] >= 0]]
+        keep = (positions >= 0) & (positions != (query_article if query_article is not None else -1))
+        positions, result_scores = positions[keep][:top_k], scores[0][ids[0] >= 0][keep][:top_k]
+        shown = [c for c in ('title', 'category', 'source') if c in df_balanced.columns]
+        results = df_balanced.iloc[positions][shown].reset_index(drop=True)
+        results.insert(0, 'similarity', result_scores)
+        results['content'] = df_balanced['cleaned_content'].iloc[positions].str.slice(0, 200).to_numpy()
+        st.dataframe(results)
+
+    with st.expander("Recall vs. brute force"):
+        n_queries = st.number_input("Benchmark queries", min_value=10, max_value=2000, value=200)
+        if st.button("Run recall benchmark"):
+            sample = np.random.default_rng(42).choice(len(semantic_index), min(int(n_queries), len(semantic_index)),
+                                                      replace=False)
+            queries = embedding_store.matrix()[np.sort(sample)]
+            st.dataframe(semantic_index.benchmark(queries, k=top_k))
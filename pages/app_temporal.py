@@ -0,0 +1,140 @@
+# app_temporal.py
+import streamlit as st
+import pandas as pd
+import seaborn as sns
+from bangla_news import app_state
+from bangla_news.app_state import show_frame_info, show_pyplot
+
+st.title("Bangla News Temporal Insights")
+
+pipeline = app_state.pipeline()
+instrumentation = app_state.instrumentation()
+
+# ------------------ Bangla date parsing ------------------
+# BN_MONTHS, parse_bangla_date and the bulk parser live in date_parsing.py.
+# The parse_dates stage parses each distinct published_date once and maps
+# the results back, returning a datetime64 column plus a report of what failed.
+parsed_dates, date_report = pipeline.get('parse_dates')
+
+# ---------------------------
+# Unparsed / Parsed rows
+# ---------------------------
+unparsed = date_report['unparsed']
+st.write(len(unparsed), "unique unparsed formats")
+st.dataframe(unparsed.head(50))  # show first 50, most frequent first
+
+st.write("Month spellings found (আগষ্ট is accepted as an alias of আগস্ট):")
+st.dataframe(date_report['months'])
+
+# ---------------------------
+# Temporal count cube
+# ---------------------------
+# category x year x month x weekday x hour counts, built once per dataset.
+# Every chart below is a sum over this array and the filters only re-slice
+# it, so no chart rescans the articles.
+temporal_cube = pipeline.get('temporal_cube')
+
+show_frame_info('temporal', 'parsed_dates', parsed_dates)
+n_parsed = temporal_cube.total
+st.write(f"Working with {n_parsed} rows (parsed successfully).")
+st.write(f"Unparsed rows are {len(parsed_dates) - n_parsed} (ignored for now).")
+
+# ---------------------------
+# Filters
+# ---------------------------
+selected_categories = st.multiselect("Categories", temporal_cube.categories, default=temporal_cube.categories)
+first_month, last_month = temporal_cube.month_range()
+if first_month is not None:
+    month_options = pd.period_range(f"{first_month[0]}-{first_month[1]:02d}",
+                                    f"{last_month[0]}-{last_month[1]:02d}", freq='M')
+    start_month, end_month = st.select_slider(
+        "Date range", options=[str(p) for p in month_options],
+        value=(str(month_options[0]), str(month_options[-1])),
+    )
+    start_month, end_month = pd.Period(start_month, 'M'), pd.Period(end_month, 'M')
+    cube = instrumentation.call('temporal_select', temporal_cube.select, selected_categories,
+                                start=(start_month.year, start_month.month),
+                                end=(end_month.year, end_month.month))
+else:
+    cube = instrumentation.call('temporal_select', temporal_cube.select, selected_categories)
+st.write(f"{cube.total} articles in the current selection.")
+
+# ---------------------------
+# Chart drawing
+# ---------------------------
+# Each chart is a function of one aggregate from the cube, so a filter
+# setting that was drawn before is served from the figure cache.
+def draw_counts(fig, counts, title, palette, rotate=False):
+    fig.set_size_inches(8, 4)
+    ax = fig.subplots()
+    sns.barplot(x=counts.index, y=counts.values, palette=palette, ax=ax)
+    ax.set_title(title)
+    ax.set_ylabel("Count")
+    if rotate:
+        ax.tick_params(axis='x', labelrotation=45)
+
+def draw_heatmap(fig, table, title, cmap, xlabel, ylabel):
+    fig.set_size_inches(12, 6)
+    ax = fig.subplots()
+    sns.heatmap(table, cmap=cmap, annot=True, fmt="d", ax=ax)
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+
+def draw_lines(fig, table, title, xlabel, ylabel):
+    fig.set_size_inches(12, 6)
+    ax = fig.subplots()
+    for cat in table.index:
+        ax.plot(table.columns, table.loc[cat], marker='o', label=cat)
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.legend()
+
+# Nothing to chart (every category deselected, or no parsed dates); seaborn
+# cannot draw an empty heatmap
+if not cube.total:
+    st.info("No articles with a parsed date in the current selection.")
+else:
+    # ---------------------------
+    # 1️⃣ Number of articles per year
+    # ---------------------------
+    show_pyplot(draw_counts, cube.by('year'), title="Articles per Year", palette="viridis")
+
+    # ---------------------------
+    # 2️⃣ Articles per month (overall)
+    # ---------------------------
+    show_pyplot(draw_counts, cube.by('month'), title="Articles per Month", palette="magma")
+
+    # ---------------------------
+    # 3️⃣ Articles per weekday
+    # ---------------------------
+    show_pyplot(draw_counts, cube.by('weekday'), title="Articles per Weekday", palette="coolwarm", rotate=True)
+
+    # ---------------------------
+    # 4️⃣ Articles per month per year (heatmap)
+    # ---------------------------
+    show_pyplot(draw_heatmap, cube.by('year', 'month'), title="Articles per Month per Year", cmap="YlGnBu",
+                xlabel="Month", ylabel="Year")
+
+    # ---------------------------
+    # 5️⃣ Articles per hour of day
+    # ---------------------------
+    show_pyplot(draw_counts, cube.by('hour', drop_empty=False), title="Articles per Hour of Day", palette="crest")
+
+    # ---------------------------
+    # Category-wise analysis
+    # ---------------------------
+    if cube.categories:
+        # 1️⃣ Articles per year per category
+        show_pyplot(draw_lines, cube.by('category', 'year'), title="Articles per Year by Category",
+                    xlabel="Year", ylabel="Number of Articles")
+
+        # 2️⃣ Articles per month per category (all years)
+        show_pyplot(draw_heatmap, cube.by('category', 'month'),
+                    title="Monthly Article Distribution by Category (All Years)", cmap="YlOrRd",
+                    xlabel="Month", ylabel="Category")
+
+        # 3️⃣ Articles per weekday per category (weekday columns already Monday..Sunday)
+        show_pyplot(draw_heatmap, cube.by('category', 'weekday'), title="Weekday Article Distribution by Category",
+                    cmap="coolwarm", xlabel="Weekday", ylabel="Category")
@@ -0,0 +1,74 @@
+# app_top_words.py
+import streamlit as st
+import os
+import plotly.express as px
+import matplotlib.font_manager as fm
+from bangla_news import app_state
+from bangla_news.app_state import show_plotly
+
+st.title("Bangla News: Top Words per Category")
+
+pipeline = app_state.pipeline()
+instrumentation = app_state.instrumentation()
+
+# ---------------------------
+# Token store and n-gram counts from the shared pipeline
+# ---------------------------
+token_store = pipeline.get('tokenize')
+ngram_counts = pipeline.get('ngram_counts')
+st.subheader("Tokenized Dataset Sample")
+st.dataframe(token_store.preview(5))
+
+# ---------------------------
+# Top 100 words per category (from the shared n-gram tables)
+# ---------------------------
+top_words_df = instrumentation.call('top_words', ngram_counts.top_k_frame, 100, n=1, column='word')
+
+st.subheader("Top Words DataFrame Sample")
+st.dataframe(top_words_df.head(10))
+
+# ---------------------------
+# Bar Chart for Top 15 Words per Category
+# ---------------------------
+font_path = "/Users/ronjonkar/Desktop/Streamlit/NotoSansBengali-Regular.ttf"  # update if needed
+fallback_font_family = "Noto Sans Bengali"
+
+if os.path.exists(font_path):
+    fm.fontManager.addfont(font_path)
+    font_family = fallback_font_family
+else:
+    st.warning("Font file not found. Using fallback font.")
+    font_family = "Nikosh"
+
+def draw_top_words(cat_df, title, font_family):
+    fig = px.bar(
+        cat_df,
+        x='frequency',
+        y='word',
+        orientation='h',
+        title=title,
+        labels={'frequency': 'Frequency', 'word': 'Word'},
+        text='frequency',
+        color='frequency',
+        color_continuous_scale='Viridis'
+    )
+
+    fig.update_traces(textposition='outside')
+    fig.update_layout(
+        yaxis={'categoryorder': 'total ascending'},
+        font=dict(family=font_family, size=16),
+        coloraxis_colorbar=dict(title="ঘনত্ব")
+    )
+    return fig
+
+st.subheader("Top 15 Words per Category")
+
+for category in top_words_df['category'].unique():
+    cat_df = (
+        top_words_df[top_words_df['category'] == category]
+        .sort_values(by='frequency', ascending=False)
+        .head(15)
+        .sort_values(by='frequency', ascending=True)  # horizontal plot
+    )
+
+    show_plotly(draw_top_words, cat_df, title=f"শ্রেণী: {category} - শীর্ষ ১৫ শব্দ", font_family=font_family)
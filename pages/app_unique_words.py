@@ -0,0 +1,50 @@
+# app_unique_words.py
+import streamlit as st
+from bangla_news import app_state
+from bangla_news.term_matrix import SCORES, CategoryTermMatrix
+
+st.title("Unique Words per Bangla News Category")
+
+pipeline = app_state.pipeline()
+instrumentation = app_state.instrumentation()
+
+# ---------------------------
+# Token store and n-gram counts from the shared pipeline
+# ---------------------------
+token_store = pipeline.get('tokenize')
+ngram_counts = pipeline.get('ngram_counts')
+st.subheader("Tokenized Dataset Sample")
+st.dataframe(token_store.preview(5))
+
+# ---------------------------
+# Sparse category x term matrix
+# ---------------------------
+# The unigram table from the shared n-gram counts is already a CSR matrix;
+# a word is unique to a category when its column has exactly one non-zero.
+term_matrix = CategoryTermMatrix(ngram_counts.unigram, ngram_counts.vocab, ngram_counts.categories)
+unique_words_by_category = instrumentation.call('unique_words', term_matrix.unique_words)
+
+# ---------------------------
+# Show results in Streamlit
+# ---------------------------
+st.subheader("Unique Words per Category (Examples)")
+
+for category, words in unique_words_by_category.items():
+    st.write(f"✅ **{len(words)} unique words** in category: **{category}**")
+    st.write("🔹 Example words:", words[:20])
+
+# ---------------------------
+# Mostly unique words
+# ---------------------------
+st.subheader("Mostly Unique Words per Category")
+col1, col2, col3, col4 = st.columns(4)
+min_share = col1.slider("Min share in category", 0.5, 1.0, 0.9, 0.01)
+min_count = col2.number_input("Min total count", min_value=1, value=5)
+score_name = col3.selectbox("Rank by", SCORES)
+top_n = col4.number_input("Words per category", min_value=5, max_value=200, value=20)
+
+mostly_unique = instrumentation.call('mostly_unique', term_matrix.mostly_unique, min_share=min_share,
+                                     min_count=int(min_count), score=score_name, top_n=int(top_n))
+for category, words_df in mostly_unique.items():
+    st.write(f"🔹 **{category}**")
+    st.dataframe(words_df)
@@ -0,0 +1,56 @@
+# app_wordcloud.py
+import streamlit as st
+import os
+from bangla_news import app_state
+
+st.title("Bangla News: WordCloud for Unigrams and Bigrams")
+
+pipeline = app_state.pipeline()
+instrumentation = app_state.instrumentation()
+
+# ---------------------------
+# Token store and n-gram counts from the shared pipeline
+# ---------------------------
+token_store = pipeline.get('tokenize')
+ngram_counts = pipeline.get('ngram_counts')
+st.subheader("Tokenized Dataset Sample")
+st.dataframe(token_store.preview(5))
+
+# ✅ Bangla font path (adjust for your system)
+font_path = "/Users/ronjonkar/Desktop/Streamlit/NotoSansBengali-Regular.ttf"
+if not os.path.exists(font_path):
+    st.warning("Bangla font file not found. WordCloud may not render properly.")
+    font_path = None  # WordCloud will use default font
+
+# ---------------------------
+# Select frequency source and category
+# ---------------------------
+ngram_names = {1: "Unigrams", 2: "Bigrams"}
+ngram_order = st.radio("Frequency source", list(ngram_names), format_func=ngram_names.get, horizontal=True)
+selected_category = st.selectbox("Select Category", ngram_counts.categories)
+
+# Top 100 n-grams of every category as dicts for WordCloud, read from the
+# shared n-gram tables
+frequency_tables = {category: ngram_counts.frequencies(category, k=100, n=ngram_order)
+                    for category in ngram_counts.categories}
+
+# ---------------------------
+# Generate WordClouds in the background
+# ---------------------------
+# All categories are queued at once (the selected one first); the service
+# keeps the PNGs, so picking another category is a cache read.
+wordclouds = app_state.get_wordcloud_service()
+wordcloud_keys = wordclouds.prefetch(frequency_tables, font_path, first=selected_category)
+
+freq_dict = frequency_tables[selected_category]
+if not freq_dict:
+    st.info(f"No {ngram_names[ngram_order].lower()} left in the {selected_category} category.")
+else:
+    with instrumentation.stage('wordcloud', rows=len(freq_dict)) as record:
+        record['cache'] = 'hit' if wordclouds.is_ready(wordcloud_keys[selected_category]) else 'miss'
+        image = wordclouds.get(selected_category, freq_dict, font_path)
+    st.subheader(f"{selected_category} category - Top 100 {ngram_names[ngram_order]}")
+    st.image(image, width='stretch')
+
+ready = sum(wordclouds.is_ready(key) for key in wordcloud_keys.values())
+st.caption(f"{ready} of {len(wordcloud_keys)} word clouds rendered")